@@ -112,6 +112,8 @@ class GameController:
         
         # 播放背景音乐
         self.assets.play_music("stage1")
+        # 后台预读 Boss 曲目，避免进入 Boss 战时同步读盘造成卡顿
+        self.assets.prefetch_music("boss")
 
         # 生成测试用掉落物
         spawn_item(
@@ -196,8 +198,7 @@ class GameController:
         player_move_system(self.state, dt)
         option_system(self.state, dt)  # 子机位置更新：在移动后、射击前
         if player_shoot_system(self.state, dt):
-            if "player_shot" in self.assets.sfx:
-                self.assets.sfx["player_shot"].play()
+            self.assets.play_sfx("player_shot")
 
         # PoC 系统：更新点收集线激活标记
         poc_system(self.state)
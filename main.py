@@ -53,6 +53,11 @@ def main():
         action="store_true",
         help="跳过主菜单直接开始游戏（需配合 -c 使用）。",
     )
+    parser.add_argument(
+        "--full-flip",
+        action="store_true",
+        help="主菜单标题画面每帧整屏刷新，不使用局部刷新（用于性能对比）。",
+    )
     args = parser.parse_args()
 
     pygame.init()
@@ -76,7 +81,7 @@ def main():
         assets = Assets()
         assets.load()
         
-        menu = MainMenu(screen, assets)
+        menu = MainMenu(screen, assets, dirty_rects=not args.full_flip)
         result, selected_character = menu.run()
         
         if result == MenuResult.EXIT:
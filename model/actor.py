@@ -3,7 +3,7 @@ Actor 实体类：ECS 架构中的实体容器。
 """
 from __future__ import annotations
 
-from typing import Dict, Type, TypeVar, Optional
+from typing import Dict, Type, TypeVar, Optional, Tuple
 
 
 T = TypeVar("T")
@@ -15,14 +15,19 @@ class Actor:
     - add(component): 添加组件
     - get(ComponentType): 获取组件
     - has(ComponentType): 检查是否有组件
+    - view(types): 一次取得多个组件（按类型元组缓存）
     """
 
     def __init__(self) -> None:
         self._components: Dict[Type, object] = {}
+        # view() 的结果缓存：{组件类型元组: 组件元组}，组件增删时失效
+        self._views: Dict[Tuple[Type, ...], Tuple[Optional[object], ...]] = {}
 
     def add(self, component: object) -> None:
         """添加组件到实体"""
         self._components[type(component)] = component
+        if self._views:
+            self._views.clear()
 
     def get(self, comp_type: Type[T]) -> Optional[T]:
         """获取指定类型的组件"""
@@ -36,3 +41,14 @@ class Actor:
         """移除指定类型的组件"""
         if comp_type in self._components:
             del self._components[comp_type]
+            if self._views:
+                self._views.clear()
+
+    def view(self, types: Tuple[Type, ...]) -> Tuple[Optional[object], ...]:
+        """按 types 的顺序一次取得多个组件（缺少的为 None），结果缓存到组件增删为止"""
+        rv = self._views.get(types)
+        if rv is None:
+            comps = self._components
+            rv = tuple([comps.get(t) for t in types])
+            self._views[types] = rv
+        return rv
@@ -516,6 +516,17 @@ class BossAttackAnimation:
     cooldown: float = 0.0         # 冷却计时器（防止连续触发）
 
 
+@dataclass
+class PlayerAnimState:
+    """
+    玩家精灵动画状态。
+    由渲染器在首次绘制玩家时添加，随 Actor 一起销毁。
+    """
+    state: str = "idle"           # 当前动作：idle / left / right
+    frame_index: int = 0          # 当前帧索引
+    timer: float = 0.0            # 帧计时器
+
+
 @dataclass
 class BossAuraState:
     """
@@ -51,6 +51,7 @@ from .components import (
     OptionState,
     PlayerShotPattern,
     DialogueState,
+    BossHudData,
 )
 from .game_config import (
     CollectConfig,
@@ -123,6 +124,8 @@ class GameState:
     sfx_requests: List[str] = field(default_factory=list)
 
     player: Optional[Actor] = None
+    # 带 BossHudData 的 Actor（由 add_actor/remove_actor 维护，渲染时免去遍历查找）
+    boss_hud_actor: Optional[Actor] = None
 
     time: float = 0.0  # 已用游戏时间（秒）
     frame: int = 0  # 帧计数
@@ -169,13 +172,25 @@ class GameState:
 
     def add_actor(self, actor: Actor) -> None:
         self.actors.append(actor)
+        if self.player is None and actor.has(PlayerTag):
+            self.player = actor
+        if self.boss_hud_actor is None and actor.has(BossHudData):
+            self.boss_hud_actor = actor
 
     def remove_actor(self, actor: Actor) -> None:
         if actor in self.actors:
             self.actors.remove(actor)
+        if actor is self.player:
+            self.player = next((a for a in self.actors if a.get(PlayerTag)), None)
+        if actor is self.boss_hud_actor:
+            self.boss_hud_actor = next((a for a in self.actors if a.has(BossHudData)), None)
 
     # 便捷辅助方法：玩家查找（预留多人模式支持）
     def get_player(self) -> Optional[Actor]:
+        # state.player 由 add_actor/remove_actor 维护，通常无需遍历
+        player = self.player
+        if player is not None and player.has(PlayerTag):
+            return player
         return next((a for a in self.actors if a.get(PlayerTag)), None)
 
     def get_players(self) -> list[Actor]:
@@ -0,0 +1,158 @@
+"""
+GameState / Actor 缓存失效的无界面测试。
+
+运行：python -m pytest -q test_state_cache.py
+"""
+import os
+
+# 无界面运行（不需要真实窗口和声卡）
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from model.actor import Actor
+from model.components import (
+    BossHudData, PlayerTag, Position, RenderHint, SpriteInfo,
+)
+from model.game_state import GameState
+
+
+RENDER_COMPONENTS = (Position, SpriteInfo, RenderHint)
+
+
+def _player() -> Actor:
+    actor = Actor()
+    actor.add(PlayerTag())
+    return actor
+
+
+def _boss() -> Actor:
+    actor = Actor()
+    actor.add(BossHudData(boss_name="boss"))
+    return actor
+
+
+# ====== GameState.boss_hud_actor ======
+
+def test_add_actor_tracks_first_boss():
+    state = GameState()
+    b1, b2 = _boss(), _boss()
+    for a in (Actor(), b1, b2):
+        state.add_actor(a)
+
+    assert state.boss_hud_actor is b1
+
+
+def test_remove_boss_clears_or_falls_back():
+    state = GameState()
+    b1, b2 = _boss(), _boss()
+    state.add_actor(b1)
+    state.add_actor(b2)
+
+    state.remove_actor(b1)
+    assert state.boss_hud_actor is b2
+
+    state.remove_actor(b2)
+    assert state.boss_hud_actor is None
+
+    # 之后新加入的 Boss 重新成为缓存对象
+    b3 = _boss()
+    state.add_actor(b3)
+    assert state.boss_hud_actor is b3
+
+
+def test_remove_other_actor_keeps_cached_boss():
+    state = GameState()
+    boss, other = _boss(), Actor()
+    state.add_actor(boss)
+    state.add_actor(other)
+
+    state.remove_actor(other)
+    assert state.boss_hud_actor is boss
+
+
+# ====== GameState.player / get_player ======
+
+def test_add_actor_tracks_first_player():
+    state = GameState()
+    p1, p2 = _player(), _player()
+    for a in (Actor(), p1, p2):
+        state.add_actor(a)
+
+    assert state.player is p1
+    assert state.get_player() is p1
+
+
+def test_remove_player_falls_back_to_remaining_player():
+    state = GameState()
+    p1, p2 = _player(), _player()
+    state.add_actor(p1)
+    state.add_actor(p2)
+
+    state.remove_actor(p1)
+    assert state.player is p2
+    assert state.get_player() is p2
+
+    state.remove_actor(p2)
+    assert state.player is None
+    assert state.get_player() is None
+
+
+def test_remove_other_actor_keeps_cached_player():
+    state = GameState()
+    player, other = _player(), Actor()
+    state.add_actor(player)
+    state.add_actor(other)
+
+    state.remove_actor(other)
+    assert state.player is player
+
+
+def test_get_player_ignores_reference_without_player_tag():
+    state = GameState()
+    p1, p2 = _player(), _player()
+    state.add_actor(p1)
+    state.add_actor(p2)
+
+    # 缓存的玩家失去 PlayerTag 后回退到遍历查找
+    p1.remove(PlayerTag)
+    assert state.get_player() is p2
+
+
+# ====== Actor.view ======
+
+def test_view_returns_components_in_order_with_none_for_missing():
+    actor = Actor()
+    pos = Position(1.0, 2.0)
+    actor.add(pos)
+
+    assert actor.view(RENDER_COMPONENTS) == (pos, None, None)
+
+
+def test_view_invalidated_on_add():
+    actor = Actor()
+    actor.add(Position(0.0, 0.0))
+    assert actor.view(RENDER_COMPONENTS)[1] is None
+
+    sprite = SpriteInfo(name="enemy")
+    actor.add(sprite)
+    assert actor.view(RENDER_COMPONENTS)[1] is sprite
+
+    # 同类型组件替换后返回新组件
+    new_pos = Position(5.0, 5.0)
+    actor.add(new_pos)
+    assert actor.view(RENDER_COMPONENTS)[0] is new_pos
+
+
+def test_view_invalidated_on_remove():
+    actor = Actor()
+    hint = RenderHint(show_hitbox=True)
+    actor.add(Position(0.0, 0.0))
+    actor.add(hint)
+    assert actor.view(RENDER_COMPONENTS)[2] is hint
+
+    actor.remove(RenderHint)
+    assert actor.view(RENDER_COMPONENTS)[2] is None
+
+    # 移除不存在的组件不影响结果
+    actor.remove(SpriteInfo)
+    assert actor.view(RENDER_COMPONENTS)[0] is not None
@@ -3,6 +3,9 @@
 """
 from __future__ import annotations
 
+import io
+import threading
+
 import pygame
 
 
@@ -11,6 +14,18 @@ class Assets:
     资源管理器：目前使用纯色形状代替实际图片。
     """
 
+    MUSIC_PATHS: dict[str, str] = {
+        "stage1": "assets/bgm/stage1_theme.flac",
+        "boss": "assets/bgm/boss_theme.flac",
+    }
+
+    # 高频音效的专用声道数：每类音效在固定声道间轮换播放
+    SFX_CHANNEL_POOLS: dict[str, int] = {
+        "player_shot": 3,
+        "enemy_damage": 3,
+        "explosion": 3,
+    }
+
     def __init__(self) -> None:
         self.images: dict[str, pygame.Surface] = {}
         self.player_frames: dict[str, list[pygame.Surface]] = {}
@@ -19,6 +34,12 @@ class Assets:
         self.sfx: dict[str, pygame.mixer.Sound] = {}
         self.font_path = "assets/fonts/OPPOSans-Bold.ttf"
         self.fonts: dict[int, pygame.font.Font] = {}
+        # BGM 预读：后台线程把曲目文件读入内存，切歌时跳过磁盘 IO
+        self._bgm_prefetch: dict[str, threading.Thread] = {}
+        self._bgm_data: dict[str, bytes] = {}
+        # SFX 专用声道池：{name: [Channel, ...]} 及各自的轮换游标
+        self._sfx_channels: dict[str, list[pygame.mixer.Channel]] = {}
+        self._sfx_cursor: dict[str, int] = {}
 
     def load(self) -> None:
         # Load Character Sprite Sheet
@@ -454,8 +475,43 @@ class Assets:
         self._load_items()
         self._load_bullets()
         self._load_vfx()
+        self._ensure_display_format()
         self._load_audio()
 
+    def _ensure_display_format(self) -> None:
+        """
+        确保所有缓存的图片都是显示格式。
+        从文件加载的图片已经 convert，这里主要处理回退占位图等程序生成的表面，
+        避免每次 blit 时都做像素格式转换。
+        """
+        display = pygame.display.get_surface()
+        if display is None:
+            return
+        opaque_masks = display.get_masks()
+        alpha_masks = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+        # 多个键可能共用同一张表面，按 id 记录以保持共享
+        converted: dict[int, pygame.Surface] = {}
+
+        def fix(surf: pygame.Surface) -> pygame.Surface:
+            result = converted.get(id(surf))
+            if result is None:
+                if surf.get_flags() & pygame.SRCALPHA:
+                    result = surf if surf.get_masks() == alpha_masks else surf.convert_alpha()
+                else:
+                    result = surf if surf.get_masks() == opaque_masks else surf.convert()
+                converted[id(surf)] = result
+            return result
+
+        for name, surf in self.images.items():
+            self.images[name] = fix(surf)
+        for frames in self.player_frames.values():
+            frames[:] = [fix(f) for f in frames]
+        for anims in self.enemy_sprites.values():
+            for frames in anims.values():
+                frames[:] = [fix(f) for f in frames]
+        for frames in self.vfx.values():
+            frames[:] = [fix(f) for f in frames]
+
     def get_image(self, name: str) -> pygame.Surface:
         """
         获取指定名称的精灵图。
@@ -466,6 +522,9 @@ class Assets:
         # 回退：品红色方块表示缺少资源
         surf = pygame.Surface((16, 16), pygame.SRCALPHA)
         surf.fill((255, 0, 255))
+        if pygame.display.get_surface() is not None:
+            # 加载后才请求的占位图同样转换为显示格式
+            surf = surf.convert_alpha()
         self.images[name] = surf
         return surf
 
@@ -948,22 +1007,63 @@ class Assets:
             except (FileNotFoundError, pygame.error) as e:
                 print(f"Failed to load SFX {path}: {e}")
 
+        self._reserve_sfx_channels()
+
+    def _reserve_sfx_channels(self) -> None:
+        """为高频音效预留声道，避免其抢占（或被抢占）其他音效的声道。"""
+        reserved = sum(self.SFX_CHANNEL_POOLS.values())
+        try:
+            if pygame.mixer.get_num_channels() < 24:
+                pygame.mixer.set_num_channels(24)
+            # 预留的声道不会被 Sound.play() 自动分配
+            pygame.mixer.set_reserved(reserved)
+            index = 0
+            for name, count in self.SFX_CHANNEL_POOLS.items():
+                self._sfx_channels[name] = [pygame.mixer.Channel(index + i) for i in range(count)]
+                self._sfx_cursor[name] = 0
+                index += count
+        except pygame.error as e:
+            print(f"Failed to reserve SFX channels: {e}")
+
+    def prefetch_music(self, name: str) -> None:
+        """在后台线程中预读 BGM 文件，供之后的 play_music 直接使用。"""
+        path = self.MUSIC_PATHS.get(name)
+        if path is None or name in self._bgm_data or name in self._bgm_prefetch:
+            return
+
+        def _worker() -> None:
+            try:
+                with open(path, "rb") as f:
+                    self._bgm_data[name] = f.read()
+            except OSError as e:
+                print(f"Failed to prefetch music {path}: {e}")
+
+        thread = threading.Thread(target=_worker, name=f"bgm-prefetch-{name}", daemon=True)
+        self._bgm_prefetch[name] = thread
+        thread.start()
+
     def play_music(self, name: str) -> None:
         """Play background music by name."""
-        music_paths = {
-            "stage1": "assets/bgm/stage1_theme.flac",
-            "boss": "assets/bgm/boss_theme.flac",
-        }
-        
         if name == "stop":
             pygame.mixer.music.stop()
             print("Music stopped")
             return
         
-        if name in music_paths:
-            path = music_paths[name]
+        if name in self.MUSIC_PATHS:
+            path = self.MUSIC_PATHS[name]
+
+            # 预读仍在进行时等待其完成（仅剩文件读取，不会比直接加载更慢）
+            thread = self._bgm_prefetch.pop(name, None)
+            if thread is not None:
+                thread.join()
+
             try:
-                pygame.mixer.music.load(path)
+                data = self._bgm_data.get(name)
+                if data is not None:
+                    # 从内存加载，namehint 让 SDL_mixer 识别格式
+                    pygame.mixer.music.load(io.BytesIO(data), path.rsplit(".", 1)[-1])
+                else:
+                    pygame.mixer.music.load(path)
                 pygame.mixer.music.set_volume(0.2) # Background music volume
                 pygame.mixer.music.play(-1) # Loop indefinitely
                 print(f"Playing music: {path}")
@@ -988,8 +1088,16 @@ class Assets:
 
     def play_sfx(self, name: str) -> None:
         """Play sound effect by name."""
-        if name in self.sfx:
-            self.sfx[name].play()
-        else:
+        sound = self.sfx.get(name)
+        if sound is None:
             # Silent fail for missing sfx to avoid spam
-            pass
+            return
+
+        channels = self._sfx_channels.get(name)
+        if channels:
+            # 在该类音效的专用声道间轮换
+            cursor = self._sfx_cursor[name]
+            self._sfx_cursor[name] = (cursor + 1) % len(channels)
+            channels[cursor].play(sound)
+        else:
+            sound.play()
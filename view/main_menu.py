@@ -4,14 +4,22 @@
 from __future__ import annotations
 
 import math
+import random
 import pygame
 from enum import Enum, auto
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from model.character import CharacterId
     from view.assets import Assets
 
 
+# 文字表面缓存的最大条目数
+TEXT_CACHE_SIZE = 256
+# 标题画面局部刷新时，把脏矩形按纵向合并成的条带数（避免逐颗星提交上百个小矩形）
+DIRTY_BANDS = 8
+
+
 class MenuState(Enum):
     """菜单状态"""
     TITLE = auto()
@@ -29,9 +37,11 @@ class MenuResult(Enum):
 class MainMenu:
     """主菜单场景"""
 
-    def __init__(self, screen: pygame.Surface, assets: Assets) -> None:
+    def __init__(self, screen: pygame.Surface, assets: Assets, dirty_rects: bool = True) -> None:
         self.screen = screen
         self.assets = assets
+        # 标题画面是否使用局部刷新（False 时每帧整屏 flip，便于对比性能）
+        self.dirty_rects = dirty_rects
         self.width = screen.get_width()
         self.height = screen.get_height()
         
@@ -49,6 +59,44 @@ class MainMenu:
         # 角色选择
         self.character_index = 0
         self.selected_character_id = None
+        # 角色列表在菜单生命周期内不变，缓存避免每帧重新构建
+        from model.character import get_all_characters, CharacterId
+        self._characters = get_all_characters()
+        self._character_ids = list(CharacterId)
+        # 预渲染的角色信息文字（名字 + 描述），按角色索引缓存
+        self._info_surfs: dict[int, tuple[pygame.Surface, int]] = {}
+        # 角色选择画面布局（尺寸固定，只计算一次）
+        margin_x = 55
+        margin_top = 130
+        margin_bot = 60
+        layout_w = self.width - margin_x * 2
+        layout_h = self.height - margin_top - margin_bot
+        self._select_layout_rect = pygame.Rect(margin_x, margin_top, layout_w, layout_h)
+        
+        # Content Inner Rect (Offset down by 25px relative to frame)
+        padding = 15
+        offset_y = 25
+        self._select_content_rect = pygame.Rect(
+            margin_x + padding,
+            margin_top + padding + offset_y,
+            layout_w - padding * 2,
+            layout_h - padding * 2
+        )
+        # 内容区域的合成表面，每帧清空复用而不是重新分配
+        content_size = self._select_content_rect.size
+        self._content_surf = pygame.Surface(content_size, pygame.SRCALPHA)
+        self._surf_left = pygame.Surface(content_size, pygame.SRCALPHA)
+        self._surf_right = pygame.Surface(content_size, pygame.SRCALPHA)
+        
+        # 角色选择分割层（两倍宽的左右遮罩模板 + 分割线），首次绘制时生成
+        self._split_layers: tuple[pygame.Surface, pygame.Surface, pygame.Surface, tuple[int, int]] | None = None
+        # 换行结果：{(id(font), text, max_width): lines}
+        self._wrap_cache: dict[tuple[int, str, int], list[str]] = {}
+        # 缩放后的立绘（含变暗版本）和选择标题：{(图片键名, 目标高度, 是否变暗): Surface}
+        self._scaled_portraits: dict[tuple[str, int, bool], pygame.Surface | None] = {}
+        self._scaled_title: pygame.Surface | None = None
+        # 标题画面的静态文字层（不含选中项），按选中索引缓存
+        self._title_static: dict[int, tuple[pygame.Surface, tuple[int, int]]] = {}
         
         # 字体
         try:
@@ -62,11 +110,12 @@ class MainMenu:
             self.font_menu = pygame.font.Font(None, 36)
             self.font_small = pygame.font.Font(None, 24)
         
-        # 输入冷却
-        self.input_cooldown = 0.0
+        # 文字表面缓存（LRU）：{(id(font), text, color): Surface}
+        self._text_cache: dict[tuple[int, str, tuple], pygame.Surface] = {}
         
-        # 星星粒子背景
-        self.stars = self._generate_stars(100)
+        # 星星粒子背景（按属性分列存储），使用独立的随机数生成器
+        self._rng = random.Random()
+        self._generate_stars(100)
         
         # 生成模糊背景 (用于角色选择界面)
         self.bg_blurred = None
@@ -82,51 +131,96 @@ class MainMenu:
              overlay.fill((0, 0, 0, 100)) # 100/255 opacity black
              blurred.blit(overlay, (0, 0))
              
-             self.bg_blurred = blurred
+             # 叠加遮罩后已不透明，转换为显示格式以走不透明快速 blit 路径
+             self.bg_blurred = blurred.convert()
              
         # 转场变量
         self.fade_alpha = 255.0 # Start with black fade-in
         self.fade_state = "IN"  # IN (255->0), OUT (0->255), NONE
+        # 转场遮罩：不透明黑色表面 + 表面 alpha，复用而不是每帧分配
+        self._fade_overlay = pygame.Surface((self.width, self.height)).convert()
+        self._fade_overlay.fill((0, 0, 0))
         self.next_menu_state = None
         self.next_result = None
         
         # Split Screen Ratio (0.0 - 1.0), 0.5 = Center
         self.split_ratio = 0.5
+        
+        # 上一帧提交到显示器的局部区域（标题画面使用 display.update 局部刷新）
+        self._prev_dirty: list[pygame.Rect] = []
+        # 下一帧必须整屏提交：转场遮罩刚消失、菜单状态切换或窗口被重新暴露时
+        self._force_full_present = True
+        self._presented_state: MenuState | None = None
     
-    def _generate_stars(self, count: int) -> list[dict]:
-        """生成星星粒子"""
-        import random
-        stars = []
+    def _generate_stars(self, count: int) -> None:
+        """生成星星粒子，每个属性一个列表（SoA），避免逐颗星的字典查找"""
+        self.star_x: list[float] = []
+        self.star_y: list[float] = []
+        self.star_speed: list[float] = []
+        self.star_size: list[int] = []
+        self.star_bright: list[int] = []
+        rng = self._rng
         for _ in range(count):
-            stars.append({
-                "x": random.randint(0, self.width),
-                "y": random.randint(0, self.height),
-                "speed": random.uniform(20, 80),
-                "size": random.randint(1, 3),
-                "brightness": random.randint(100, 255),
-            })
-        return stars
+            self.star_x.append(rng.randrange(self.width + 1))
+            self.star_y.append(rng.randrange(self.height + 1))
+            self.star_speed.append(rng.uniform(20, 80))
+            self.star_size.append(rng.randrange(1, 4))
+            self.star_bright.append(rng.randrange(100, 256))
+        
+        # 每种 (大小, 亮度) 组合预渲染一个圆点精灵：{key: (Surface, 相对圆心的偏移)}
+        self._star_sprites: dict[tuple[int, int], tuple[pygame.Surface, tuple[int, int]]] = {}
+        for key in set(zip(self.star_size, self.star_bright)):
+            self._star_sprites[key] = self._build_star_sprite(*key)
+    
+    @staticmethod
+    def _build_star_sprite(size: int, brightness: int) -> tuple[pygame.Surface, tuple[int, int]]:
+        """用一次 draw.circle 画出圆点并裁剪，黑色作为透明色键"""
+        canvas = pygame.Surface((size * 2 + 2, size * 2 + 2))
+        rect = pygame.draw.circle(canvas, (brightness, brightness, brightness), (size + 1, size + 1), size)
+        # 转换为显示格式，逐帧上百次 blit 都走快速路径
+        sprite = canvas.subsurface(rect).copy().convert()
+        sprite.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return sprite, (rect.x - size - 1, rect.y - size - 1)
     
     def _update_stars(self, dt: float) -> None:
         """更新星星粒子"""
-        for star in self.stars:
-            star["y"] += star["speed"] * dt
-            if star["y"] > self.height:
-                star["y"] = 0
-                star["x"] = __import__("random").randint(0, self.width)
+        height = self.height
+        randrange = self._rng.randrange
+        ys = [y + v * dt for y, v in zip(self.star_y, self.star_speed)]
+        for i, y in enumerate(ys):
+            if y > height:
+                ys[i] = 0
+                self.star_x[i] = randrange(self.width + 1)
+        self.star_y = ys
     
-    def _draw_stars(self) -> None:
-        """绘制星星粒子"""
-        for star in self.stars:
-            brightness = star["brightness"]
-            color = (brightness, brightness, brightness)
-            pygame.draw.circle(
-                self.screen, 
-                color, 
-                (int(star["x"]), int(star["y"])), 
-                star["size"]
-            )
+    def _draw_stars(self) -> list[pygame.Rect]:
+        """绘制星星粒子，返回本帧绘制的区域"""
+        sprites = self._star_sprites
+        blit_list = []
+        for x, y, key in zip(self.star_x, self.star_y, zip(self.star_size, self.star_bright)):
+            sprite, (ox, oy) = sprites[key]
+            blit_list.append((sprite, (int(x) + ox, int(y) + oy)))
+        # 一次 blits 调用完成全部绘制，并返回各自的区域
+        return self.screen.blits(blit_list)
     
+    def _render_cached(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: tuple[int, int, int],
+    ) -> pygame.Surface:
+        """渲染文字并缓存结果，静态文字每帧只需一次 blit"""
+        key = (id(font), text, color)
+        cache = self._text_cache
+        # 取出后重新插入，保持字典顺序即最近使用顺序
+        surf = cache.pop(key, None)
+        if surf is None:
+            surf = font.render(text, True, color).convert_alpha()
+            if len(cache) >= TEXT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        cache[key] = surf
+        return surf
+
     def _draw_text_with_shadow(
         self, 
         text: str, 
@@ -136,16 +230,23 @@ class MainMenu:
         y: int,
         center: bool = False,
         shadow_offset: int = 2,
-        target_surface: pygame.Surface = None
-    ) -> None:
-        """绘制带阴影的文字"""
+        target_surface: pygame.Surface = None,
+        premultiplied: bool = False
+    ) -> pygame.Rect:
+        """
+        绘制带阴影的文字，返回覆盖的区域。
+        premultiplied 时按预乘 alpha 合成（目标为预乘的透明图层），
+        图层之后用 BLEND_PREMULTIPLIED 贴到屏幕，结果与直接绘制一致。
+        """
         surf = target_surface if target_surface else self.screen
         
-        shadow_color = (0, 0, 0)
-        
-        # 阴影
-        shadow_surf = font.render(text, True, shadow_color)
-        main_surf = font.render(text, True, color)
+        shadow_surf = self._render_cached(font, text, (0, 0, 0))
+        main_surf = self._render_cached(font, text, color)
+        flags = 0
+        if premultiplied:
+            shadow_surf = shadow_surf.premul_alpha()
+            main_surf = main_surf.premul_alpha()
+            flags = pygame.BLEND_PREMULTIPLIED
         
         if center:
             main_rect = main_surf.get_rect(center=(x, y))
@@ -154,84 +255,49 @@ class MainMenu:
             main_rect = main_surf.get_rect(topleft=(x, y))
             shadow_rect = shadow_surf.get_rect(topleft=(x + shadow_offset, y + shadow_offset))
         
-        surf.blit(shadow_surf, shadow_rect)
-        surf.blit(main_surf, main_rect)
+        surf.blit(shadow_surf, shadow_rect, special_flags=flags)
+        surf.blit(main_surf, main_rect, special_flags=flags)
+        return main_rect.union(shadow_rect)
     
-    def _draw_title_screen(self) -> None:
-        """绘制标题画面"""
-        # 标题
-        title_y = 120
-        wave = math.sin(self.time * 2) * 5
-        
-        # 如果有带 Logo 的背景图，跳过标题和副标题绘制
+    # 标题画面布局
+    TITLE_Y = 120
+    MENU_START_Y = 400  # 300 -> 400
+    MENU_SPACING = 60   # 50 -> 60 (Spacing slightly increased for bigger font)
+
+    def _build_title_static(self, selected_index: int) -> tuple[pygame.Surface, tuple[int, int]]:
+        """
+        预渲染标题画面中不随时间变化的文字（副标题、未选中项、提示、版权），返回 (表面, 左上角坐标)。
+        图层按预乘 alpha 合成，绘制时需使用 BLEND_PREMULTIPLIED，否则文字边缘的 alpha 会被叠乘两次。
+        """
+        surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        
+        # 如果有带 Logo 的背景图，跳过副标题绘制
         if "menu_bg" not in self.assets.images:
-            # 游戏标题
-            logo_img = self.assets.images.get("menu_logo")
-            if logo_img:
-                # Draw Logo Image
-                logo_rect = logo_img.get_rect(center=(self.width // 2, int(title_y + wave)))
-                self.screen.blit(logo_img, logo_rect)
-            else:
-                self._draw_text_with_shadow(
-                    "MajoSaipanKontonSei",
-                    self.font_title,
-                    (255, 220, 100),
-                    self.width // 2,
-                    int(title_y + wave),
-                    center=True,
-                    shadow_offset=3
-                )
-            
             # 副标题
             self._draw_text_with_shadow(
                 "~ Chaos Reign ~",
                 self.font_subtitle,
                 (200, 180, 255),
                 self.width // 2,
-                title_y + 60,
-                center=True
+                self.TITLE_Y + 60,
+                center=True,
+                target_surface=surf,
+                premultiplied=True,
             )
         
-        # 菜单选项
-        menu_start_y = 400 # 300 -> 400
-        menu_spacing = 60  # 50 -> 60 (Spacing slightly increased for bigger font)
-        
+        # 未选中的菜单选项（选中项每帧单独绘制）
         for i, item in enumerate(self.menu_items):
-            is_selected = (i == self.selected_index)
-            
-            # 选中效果
-            if is_selected:
-                # 闪烁高亮
-                alpha = int(180 + 75 * math.sin(self.time * 6))
-                color = (255, 255, alpha)
-                # 箭头指示器
-                arrow_x = self.width // 2 - 100
-                arrow_wave = math.sin(self.time * 8) * 5
-                
-                cursor_img = self.assets.images.get("menu_cursor")
-                if cursor_img:
-                    # Image Cursor
-                    cursor_rect = cursor_img.get_rect(center=(int(arrow_x + arrow_wave), menu_start_y + i * menu_spacing))
-                    self.screen.blit(cursor_img, cursor_rect)
-                else:
-                    self._draw_text_with_shadow(
-                        "▶",
-                        self.font_menu,
-                        (255, 100, 100),
-                        int(arrow_x + arrow_wave),
-                        menu_start_y + i * menu_spacing,
-                        center=True
-                    )
-            else:
-                color = (180, 180, 180)
-            
+            if i == selected_index:
+                continue
             self._draw_text_with_shadow(
                 item,
                 self.font_menu,
-                color,
+                (180, 180, 180),
                 self.width // 2,
-                menu_start_y + i * menu_spacing,
-                center=True
+                self.MENU_START_Y + i * self.MENU_SPACING,
+                center=True,
+                target_surface=surf,
+                premultiplied=True,
             )
         
         # 底部提示
@@ -242,7 +308,9 @@ class MainMenu:
             (150, 150, 150),
             self.width // 2,
             hint_y,
-            center=True
+            center=True,
+            target_surface=surf,
+            premultiplied=True,
         )
         
         # 版权信息
@@ -252,29 +320,214 @@ class MainMenu:
             (100, 100, 100),
             self.width // 2,
             hint_y + 30,
-            center=True
+            center=True,
+            target_surface=surf,
+            premultiplied=True,
         )
+        
+        # 只保留有内容的区域，减少每帧的透明混合面积
+        bounds = surf.get_bounding_rect()
+        static = surf.subsurface(bounds).copy()
+        return static, bounds.topleft
+
+    def _draw_title_screen(self) -> list[pygame.Rect]:
+        """绘制标题画面，返回随时间变化（需要逐帧刷新）的区域"""
+        animated: list[pygame.Rect] = []
+        
+        # 静态文字层
+        static = self._title_static.get(self.selected_index)
+        if static is None:
+            static = self._build_title_static(self.selected_index)
+            self._title_static[self.selected_index] = static
+        self.screen.blit(*static, special_flags=pygame.BLEND_PREMULTIPLIED)
+        
+        # 标题
+        title_y = self.TITLE_Y
+        wave = math.sin(self.time * 2) * 5
+        
+        # 如果有带 Logo 的背景图，跳过标题绘制
+        if "menu_bg" not in self.assets.images:
+            # 游戏标题
+            logo_img = self.assets.images.get("menu_logo")
+            if logo_img:
+                # Draw Logo Image
+                logo_rect = logo_img.get_rect(center=(self.width // 2, int(title_y + wave)))
+                animated.append(self.screen.blit(logo_img, logo_rect))
+            else:
+                animated.append(self._draw_text_with_shadow(
+                    "MajoSaipanKontonSei",
+                    self.font_title,
+                    (255, 220, 100),
+                    self.width // 2,
+                    int(title_y + wave),
+                    center=True,
+                    shadow_offset=3
+                ))
+        
+        # 选中的菜单选项
+        i = self.selected_index
+        item_y = self.MENU_START_Y + i * self.MENU_SPACING
+        
+        # 闪烁高亮
+        alpha = int(180 + 75 * math.sin(self.time * 6))
+        color = (255, 255, alpha)
+        # 箭头指示器
+        arrow_x = self.width // 2 - 100
+        arrow_wave = math.sin(self.time * 8) * 5
+        
+        cursor_img = self.assets.images.get("menu_cursor")
+        if cursor_img:
+            # Image Cursor
+            cursor_rect = cursor_img.get_rect(center=(int(arrow_x + arrow_wave), item_y))
+            animated.append(self.screen.blit(cursor_img, cursor_rect))
+        else:
+            animated.append(self._draw_text_with_shadow(
+                "▶",
+                self.font_menu,
+                (255, 100, 100),
+                int(arrow_x + arrow_wave),
+                item_y,
+                center=True
+            ))
+        
+        animated.append(self._draw_text_with_shadow(
+            self.menu_items[i],
+            self.font_menu,
+            color,
+            self.width // 2,
+            item_y,
+            center=True
+        ))
+        
+        return animated
     
     def _wrap_text(self, text: str, font: pygame.font.Font, max_width: int) -> list[str]:
-        """简单的多行文本换行逻辑"""
+        """多行文本换行（按字符），结果缓存"""
+        key = (id(font), text, max_width)
+        lines = self._wrap_cache.get(key)
+        if lines is not None:
+            return lines
+        
+        def fits(end: int) -> bool:
+            return font.size(text[start:end])[0] <= max_width
+        
         lines = []
-        current_line = ""
-        for char in text:
-            test_line = current_line + char
-            # 检查宽度
-            if font.size(test_line)[0] <= max_width:
-                current_line = test_line
+        start = 0
+        n = len(text)
+        guess = 1
+        while start < n:
+            # 以上一行的长度作为首次试探（等宽的中文通常每行字数相同），
+            # 放得下则倍增步长找到第一个放不下的位置，再二分出每行最多能放的字符数
+            lo = start
+            probe = start + guess
+            if probe <= n and fits(probe):
+                lo = probe
+                step = 1
+                while lo + step <= n and fits(lo + step):
+                    lo += step
+                    step *= 2
+                hi = min(lo + step, n + 1)
             else:
-                lines.append(current_line)
-                current_line = char
-        if current_line:
-            lines.append(current_line)
+                hi = min(probe, n + 1)
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if fits(mid):
+                    lo = mid
+                else:
+                    hi = mid
+            # 单个字符就超宽时也至少放一个
+            end = max(lo, start + 1)
+            lines.append(text[start:end])
+            guess = end - start
+            start = end
+        
+        self._wrap_cache[key] = lines
         return lines
 
+    def _build_info_surf(
+        self,
+        character,
+        name_color: tuple[int, int, int],
+        desc_color: tuple[int, int, int],
+    ) -> tuple[pygame.Surface, int]:
+        """预渲染角色名和描述文字到一张透明表面，返回 (表面, 名字中心的 Y 坐标)"""
+        wrapped_lines = self._wrap_text(character.description, self.font_small, 260)
+        name_w, name_h = self.font_title.size(character.name)
+        line_h = self.font_small.get_height()
+        widths = [name_w] + [self.font_small.size(line)[0] for line in wrapped_lines]
+
+        # 预留阴影偏移的边距
+        pad = 4
+        w = max(widths) + pad * 2
+        anchor_y = name_h // 2 + pad
+        h = anchor_y + 50 + len(wrapped_lines) * 22 + line_h // 2 + pad
+
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        cx = w // 2
+        self._draw_text_with_shadow(character.name, self.font_title, name_color, cx, anchor_y, center=True, target_surface=surf)
+        for i, line in enumerate(wrapped_lines):
+            self._draw_text_with_shadow(line, self.font_small, desc_color, cx, anchor_y + 50 + i * 22, center=True, target_surface=surf)
+        return surf, anchor_y
+
+    def _get_scaled_portrait(self, key: str, target_h: int, dimmed: bool = False) -> pygame.Surface | None:
+        """获取缩放到目标高度的立绘 (Auto-Scale)，dimmed 时返回变暗版本（未选中一侧），结果缓存"""
+        cache_key = (key, target_h, dimmed)
+        if cache_key in self._scaled_portraits:
+            return self._scaled_portraits[cache_key]
+        
+        if dimmed:
+            # Darken Inactive Layer：在缩放后的立绘上变暗一次
+            img = self._get_scaled_portrait(key, target_h)
+            if img:
+                img = img.copy()
+                img.fill((100, 100, 100, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        else:
+            img = self.assets.images.get(key)
+            if img:
+                w, h = img.get_size()
+                if abs(h - target_h) > 5:
+                    ratio = target_h / h
+                    new_w = int(w * ratio)
+                    new_h = int(h * ratio)
+                    img = pygame.transform.smoothscale(img, (new_w, new_h))
+        self._scaled_portraits[cache_key] = img
+        return img
+
+    def _get_split_layers(
+        self,
+        tilt: int,
+        content_w: int,
+        content_h: int,
+    ) -> tuple[pygame.Surface, pygame.Surface, pygame.Surface, tuple[int, int]]:
+        """
+        获取左右分割遮罩模板和分割线（只生成一次）。
+        遮罩模板宽度为内容区的两倍，分割线位于 x = content_w 处；
+        分割线在 split_x 时取模板中 x 从 content_w - split_x 开始、宽 content_w 的区域。
+        多边形和线段都按整数像素光栅化，平移后与逐帧绘制的结果一致。
+        返回 (左遮罩模板, 右遮罩模板, 分割线, 分割线相对 split_x 的偏移)。
+        """
+        layers = self._split_layers
+        if layers is None:
+            full_w = content_w * 2
+            top_x = content_w + tilt
+            bot_x = content_w - tilt
+            mask_left = pygame.Surface((full_w, content_h), pygame.SRCALPHA)
+            pygame.draw.polygon(mask_left, (255, 255, 255), [(0,0), (top_x, 0), (bot_x, content_h), (0, content_h)])
+            mask_right = pygame.Surface((full_w, content_h), pygame.SRCALPHA)
+            pygame.draw.polygon(mask_right, (255, 255, 255), [(top_x, 0), (full_w, 0), (full_w, content_h), (bot_x, content_h)])
+            
+            # Divider Line：画到透明表面后裁剪成小图
+            canvas = pygame.Surface((full_w, content_h), pygame.SRCALPHA)
+            line_rect = pygame.draw.line(canvas, (255, 255, 200), (top_x, 0), (bot_x, content_h), 4)
+            divider = canvas.subsurface(line_rect).copy()
+            
+            layers = (mask_left, mask_right, divider, (line_rect.x - content_w, line_rect.y))
+            self._split_layers = layers
+        return layers
+
     def _draw_character_select(self) -> None:
         """绘制双角色对决选择画面 (带缩放和边框)"""
-        from model.character import get_all_characters
-        characters = get_all_characters()
+        characters = self._characters
         if not characters: return
 
         # ==========================
@@ -282,10 +535,13 @@ class MainMenu:
         # ==========================
         title_img = self.assets.images.get("select_title")
         if title_img:
-            # Scale up (1.25x)
-            w, h = title_img.get_size()
-            new_size = (int(w * 1.25), int(h * 1.25))
-            title_scaled = pygame.transform.smoothscale(title_img, new_size)
+            # Scale up (1.25x)，只缩放一次
+            title_scaled = self._scaled_title
+            if title_scaled is None:
+                w, h = title_img.get_size()
+                new_size = (int(w * 1.25), int(h * 1.25))
+                title_scaled = pygame.transform.smoothscale(title_img, new_size)
+                self._scaled_title = title_scaled
             
             # Draw centered at Y=50
             rect = title_scaled.get_rect(center=(self.width // 2, 50))
@@ -294,28 +550,15 @@ class MainMenu:
             self._draw_text_with_shadow("CHARACTER SELECT", self.font_title, (255, 220, 100), self.width // 2, 30, center=True)
 
         # ==========================
-        # 2. 定义内容区域 (Content Area)
+        # 2. 内容区域 (Content Area)
         # ==========================
-        margin_x = 55
-        margin_top = 130
-        margin_bot = 60
-        layout_w = self.width - margin_x * 2
-        layout_h = self.height - margin_top - margin_bot
-        layout_rect = pygame.Rect(margin_x, margin_top, layout_w, layout_h)
-        
-        # Content Inner Rect (Offset down by 25px relative to frame)
-        padding = 15
-        offset_y = 25
-        content_rect = pygame.Rect(
-            layout_rect.left + padding,
-            layout_rect.top + padding + offset_y,
-            layout_w - padding * 2,
-            layout_h - padding * 2
-        )
+        layout_rect = self._select_layout_rect
+        content_rect = self._select_content_rect
         content_w, content_h = content_rect.size
         
-        # 创建内容表面 (用于剪裁和绘图)
-        content_surf = pygame.Surface((content_w, content_h), pygame.SRCALPHA)
+        # 内容表面 (用于剪裁和绘图)，复用并清空
+        content_surf = self._content_surf
+        content_surf.fill((0, 0, 0, 0))
         
         # ==========================
         # 3. 绘制角色 (Split Logic)
@@ -323,11 +566,11 @@ class MainMenu:
         # 计算相对坐标
         split_cx = content_w * self.split_ratio
         tilt = 60
-        top_x = split_cx + tilt
-        bot_x = split_cx - tilt
         
-        surf_left = pygame.Surface((content_w, content_h), pygame.SRCALPHA)
-        surf_right = pygame.Surface((content_w, content_h), pygame.SRCALPHA)
+        surf_left = self._surf_left
+        surf_right = self._surf_right
+        surf_left.fill((0, 0, 0, 0))
+        surf_right.fill((0, 0, 0, 0))
         
         active_idx = self.character_index
         
@@ -339,57 +582,32 @@ class MainMenu:
             key_ema = "portrait_ema_blur"
             key_hero = "portrait_hero"
             
-        # Draw Left (Ema)
-        p_reimu = self.assets.images.get(key_ema)
+        # Draw Left (Ema)，未选中的一侧使用缓存的变暗立绘
+        p_reimu = self._get_scaled_portrait(key_ema, content_h + 20, dimmed=(active_idx == 1))
         if p_reimu:
-            # Auto-Scale
-            rw, rh = p_reimu.get_size()
-            target_h = content_h + 20
-            if abs(rh - target_h) > 5:
-                ratio = target_h / rh
-                new_w = int(rw * ratio)
-                new_h = int(rh * ratio)
-                p_reimu = pygame.transform.smoothscale(p_reimu, (new_w, new_h))
-                
             # 调整位置 (相对于 content_surf)
             r_rect = p_reimu.get_rect(midbottom=(content_w * 0.25, content_h + 10))
             surf_left.blit(p_reimu, r_rect)
             
         # Draw Right (Hero)
-        p_marisa = self.assets.images.get(key_hero)
+        p_marisa = self._get_scaled_portrait(key_hero, content_h + 20, dimmed=(active_idx == 0))
         if p_marisa:
-            mw, mh = p_marisa.get_size()
-            target_h = content_h + 20
-            if abs(mh - target_h) > 5:
-                ratio = target_h / mh
-                new_w = int(mw * ratio)
-                new_h = int(mh * ratio)
-                p_marisa = pygame.transform.smoothscale(p_marisa, (new_w, new_h))
-
             m_rect = p_marisa.get_rect(midbottom=(content_w * 0.75, content_h + 10))
             surf_right.blit(p_marisa, m_rect)
             
-        # Darken Inactive Layer
-        if active_idx == 1: # Right Active -> Darken Left
-            surf_left.fill((100, 100, 100, 255), special_flags=pygame.BLEND_RGBA_MULT)
-        else: # Left Active -> Darken Right
-            surf_right.fill((100, 100, 100, 255), special_flags=pygame.BLEND_RGBA_MULT)
-            
-        # Apply Masks (Relative)
-        mask_left = pygame.Surface((content_w, content_h), pygame.SRCALPHA)
-        pygame.draw.polygon(mask_left, (255, 255, 255), [(0,0), (top_x, 0), (bot_x, content_h), (0, content_h)])
-        surf_left.blit(mask_left, (0,0), special_flags=pygame.BLEND_RGBA_MULT)
-        
-        mask_right = pygame.Surface((content_w, content_h), pygame.SRCALPHA)
-        pygame.draw.polygon(mask_right, (255, 255, 255), [(top_x, 0), (content_w, 0), (content_w, content_h), (bot_x, content_h)])
-        surf_right.blit(mask_right, (0,0), special_flags=pygame.BLEND_RGBA_MULT)
+        # Apply Masks (Relative)：从两倍宽的模板中取出当前分割位置对应的区域
+        split_x = int(split_cx)
+        mask_left, mask_right, divider, (div_dx, div_y) = self._get_split_layers(tilt, content_w, content_h)
+        mask_area = (content_w - split_x, 0, content_w, content_h)
+        surf_left.blit(mask_left, (0,0), mask_area, special_flags=pygame.BLEND_RGBA_MULT)
+        surf_right.blit(mask_right, (0,0), mask_area, special_flags=pygame.BLEND_RGBA_MULT)
         
         # Composite
         content_surf.blit(surf_left, (0,0))
         content_surf.blit(surf_right, (0,0))
         
         # Divider Line
-        pygame.draw.line(content_surf, (255, 255, 200), (top_x, 0), (bot_x, content_h), 4)
+        content_surf.blit(divider, (split_x + div_dx, div_y))
         
         # ==========================
         # 4. 绘制信息文字 (On Content Surf)
@@ -406,15 +624,13 @@ class MainMenu:
             name_color = (220, 20, 60) # Crimson
             desc_color = (255, 160, 160) # Lighter Red
             
-        # Name
-        self._draw_text_with_shadow(active_char.name, self.font_title, name_color, text_cx, info_y, center=True, target_surface=content_surf)
-        
-        # Desc
-        wrapped_lines = self._wrap_text(active_char.description, self.font_small, 260)
-        desc_y = info_y + 50
-        for i, line in enumerate(wrapped_lines):
-            self._draw_text_with_shadow(line, self.font_small, desc_color, text_cx, desc_y + i * 22, center=True, target_surface=content_surf)
-            
+        # Name + Desc (静态内容，每个角色只渲染一次)
+        cached = self._info_surfs.get(active_idx)
+        if cached is None:
+            cached = self._build_info_surf(active_char, name_color, desc_color)
+            self._info_surfs[active_idx] = cached
+        info_surf, anchor_y = cached
+        content_surf.blit(info_surf, (int(text_cx) - info_surf.get_width() // 2, int(info_y) - anchor_y))
 
 
         # ==========================
@@ -434,26 +650,17 @@ class MainMenu:
             # Fallback Border
             pygame.draw.rect(self.screen, (180, 160, 100), layout_rect, 3, border_radius=4)
     
-    def handle_input(self, dt: float) -> MenuResult:
-        """处理输入，返回菜单结果"""
-        self.input_cooldown -= dt
-        if self.input_cooldown > 0:
-            return MenuResult.NONE
-        
-        keys = pygame.key.get_pressed()
-        
+    def handle_input(self, key: int) -> MenuResult:
+        """处理一次按键按下（KEYDOWN），返回菜单结果"""
         if self.state == MenuState.TITLE:
             # 标题菜单
-            if keys[pygame.K_UP]:
+            if key == pygame.K_UP:
                 self.selected_index = (self.selected_index - 1) % len(self.menu_items)
-                self.input_cooldown = 0.15
                 self.assets.play_sfx("menu_select")
-            elif keys[pygame.K_DOWN]:
+            elif key == pygame.K_DOWN:
                 self.selected_index = (self.selected_index + 1) % len(self.menu_items)
-                self.input_cooldown = 0.15
                 self.assets.play_sfx("menu_select")
-            elif keys[pygame.K_z] or keys[pygame.K_RETURN]:
-                self.input_cooldown = 0.2
+            elif key in (pygame.K_z, pygame.K_RETURN):
                 self.assets.play_sfx("menu_confirm")
                 if self.selected_index == 0:
                     # 开始游戏 -> 触发转场 -> 角色选择
@@ -466,42 +673,37 @@ class MainMenu:
                     self.fade_state = "OUT"
                     self.next_result = MenuResult.EXIT
                     return MenuResult.NONE
-            elif keys[pygame.K_ESCAPE]:
+            elif key == pygame.K_ESCAPE:
                 self.fade_state = "OUT"
                 self.next_result = MenuResult.EXIT
                 return MenuResult.NONE
         
         elif self.state == MenuState.CHARACTER_SELECT:
-            from model.character import get_all_characters, CharacterId
-            characters = get_all_characters()
+            characters = self._characters
             
-            if keys[pygame.K_LEFT]:
+            if key == pygame.K_LEFT:
                 self.character_index = (self.character_index - 1) % len(characters)
-                self.input_cooldown = 0.15
                 self.assets.play_sfx("menu_select")
-            elif keys[pygame.K_RIGHT]:
+            elif key == pygame.K_RIGHT:
                 self.character_index = (self.character_index + 1) % len(characters)
-                self.input_cooldown = 0.15
                 self.assets.play_sfx("menu_select")
-            elif keys[pygame.K_z] or keys[pygame.K_RETURN]:
+            elif key in (pygame.K_z, pygame.K_RETURN):
                 # 选中角色并开始游戏 -> 触发转场
-                self.selected_character_id = list(CharacterId)[self.character_index]
-                self.input_cooldown = 0.2
+                self.selected_character_id = self._character_ids[self.character_index]
                 self.assets.play_sfx("menu_confirm")
                 self.fade_state = "OUT"
                 self.next_result = MenuResult.START_GAME
                 return MenuResult.NONE
-            elif keys[pygame.K_x] or keys[pygame.K_ESCAPE]:
+            elif key in (pygame.K_x, pygame.K_ESCAPE):
                 # 返回标题 -> 触发转场
                 self.fade_state = "OUT"
                 self.next_menu_state = MenuState.TITLE
-                self.input_cooldown = 0.2
                 return MenuResult.NONE
         
         return MenuResult.NONE
     
-    def update(self, dt: float) -> MenuResult:
-        """更新菜单状态"""
+    def update(self, dt: float, events: list[pygame.event.Event]) -> MenuResult:
+        """更新菜单状态，events 为本帧从事件队列取出的事件"""
         self.time += dt
         
         # 转场逻辑
@@ -521,19 +723,23 @@ class MainMenu:
                     self.state = self.next_menu_state
                     self.next_menu_state = None
                     self.fade_state = "IN"
-                    self.input_cooldown = 0.2
                     
                     # Reset Split Ratio for Character Select
                     if self.state == MenuState.CHARACTER_SELECT:
                         self.split_ratio = 0.5
         
-        # 只有在没有转场时才处理输入
-        if self.fade_state == "NONE":
-            result = self.handle_input(dt)
-            if result != MenuResult.NONE:
-                return result
-        elif self.input_cooldown > 0:
-            self.input_cooldown -= dt
+        # 处理事件：按键按下即触发一次，无需轮询和冷却
+        for event in events:
+            if event.type == pygame.QUIT:
+                return MenuResult.EXIT
+            # 窗口被遮挡后重新显示，显示器内容已失效，下一帧整屏提交
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self._force_full_present = True
+            # 只有在没有转场时才处理输入
+            if event.type == pygame.KEYDOWN and self.fade_state == "NONE":
+                result = self.handle_input(event.key)
+                if result != MenuResult.NONE:
+                    return result
             
         # Dual-Split Animation (Only animate when fully visible)
         if self.state == MenuState.CHARACTER_SELECT and self.fade_state == "NONE":
@@ -543,11 +749,6 @@ class MainMenu:
             
         self._update_stars(dt)
         
-        # 处理事件
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return MenuResult.EXIT
-        
         return MenuResult.NONE
     
     def render(self) -> None:
@@ -568,26 +769,51 @@ class MainMenu:
             self.screen.fill((15, 10, 30))
         
         # 星星粒子
-        self._draw_stars()
+        dirty = self._draw_stars()
         
         # 根据状态绘制
+        full_present = True
         if self.state == MenuState.TITLE:
-            self._draw_title_screen()
+            dirty += self._draw_title_screen()
+            # 标题画面的背景和文字静止不动，只需提交变化的区域
+            full_present = not self.dirty_rects
         elif self.state == MenuState.CHARACTER_SELECT:
             self._draw_character_select()
             
         # 转场遮罩
         if self.fade_alpha > 1:
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, int(min(255, self.fade_alpha))))
-            self.screen.blit(overlay, (0, 0))
-        
-        pygame.display.flip()
+            self._fade_overlay.set_alpha(int(min(255, self.fade_alpha)))
+            self.screen.blit(self._fade_overlay, (0, 0))
+            full_present = True
+            # 遮罩消失后的第一帧仍要整屏提交，否则残留的半透明遮罩只在脏区域被擦掉
+            self._force_full_present = True
+        elif self._force_full_present or self.state != self._presented_state:
+            full_present = True
+            self._force_full_present = False
+        self._presented_state = self.state
+        
+        if full_present:
+            pygame.display.flip()
+            self._prev_dirty = []
+        else:
+            # 上一帧的区域也要提交，以擦除移动前的位置
+            rects = self._merge_dirty(self._prev_dirty + dirty)
+            if rects:
+                pygame.display.update(rects)
+            self._prev_dirty = dirty
+    
+    def _merge_dirty(self, rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        """把脏矩形按所在的横向条带合并，每个条带只提交一个外接矩形"""
+        band_h = -(-self.height // DIRTY_BANDS)
+        bands: dict[int, pygame.Rect] = {}
+        for r in rects:
+            i = min(max(r.y // band_h, 0), DIRTY_BANDS - 1)
+            band = bands.get(i)
+            bands[i] = r if band is None else band.union(r)
+        return list(bands.values())
     
-    def run(self) -> tuple[MenuResult, "CharacterId | None"]:
+    def run(self) -> tuple[MenuResult, CharacterId | None]:
         """运行菜单循环，返回结果和选中的角色 ID"""
-        from model.character import CharacterId
-        
         clock = pygame.time.Clock()
         
         # Play Menu BGM
@@ -601,12 +827,13 @@ class MainMenu:
         while True:
             dt = clock.tick(60) / 1000.0
             
-            result = self.update(dt)
+            # 每帧只在主循环中取一次事件队列
+            result = self.update(dt, pygame.event.get())
             
             if result == MenuResult.START_GAME:
                 # 如果没有在角色选择中选择角色，使用默认
                 if self.selected_character_id is None:
-                    self.selected_character_id = list(CharacterId)[0]
+                    self.selected_character_id = self._character_ids[0]
                 return (result, self.selected_character_id)
             elif result == MenuResult.EXIT:
                 return (result, None)
@@ -12,11 +12,20 @@ from model.components import (
     EnemyKindTag, EnemyKind,
     EnemyBulletKindTag, EnemyBulletKind,
     LaserTag, LaserState, LaserType,
-    PlayerDamageState,
+    PlayerDamageState, PlayerAnimState,
     Shockwave,
 )
 from model.game_config import CollectConfig
 
+# 渲染热路径一次取得的组件：Actor.view(RENDER_COMPONENTS) -> (Position, SpriteInfo, RenderHint)
+RENDER_COMPONENTS = (Position, SpriteInfo, RenderHint)
+
+
+# ====== 画面布局 ======
+# 左侧游戏区域宽度、右侧侧边栏宽度，以及对话框布局所用的游戏区域高度
+GAME_WIDTH = 480
+SIDEBAR_WIDTH = 240
+GAME_HEIGHT = 640
 
 # ====== 玩家子弹类型 → 精灵映射表 ======
 # View 层统一管理子弹贴图配置
@@ -62,6 +71,27 @@ ENEMY_BULLET_SPRITES: dict[EnemyBulletKind, tuple[str, int, int]] = {
 }
 DEFAULT_ENEMY_BULLET_SPRITE = ("enemy_bullet_basic", -4, -4)
 
+# HUD 文字表面缓存的最大条目数
+HUD_TEXT_CACHE_SIZE = 64
+# 合成描边文字缓存的最大条目数
+OUTLINED_TEXT_CACHE_SIZE = 64
+# 擦弹范围覆盖层缓存的最大条目数（半径通常只有少数几种）
+GRAZE_OVERLAY_CACHE_SIZE = 32
+# 子弹旋转角度量化步长（度）及旋转结果缓存的最大条目数
+BULLET_ROTATION_STEP = 5
+BULLET_ROTATION_CACHE_SIZE = 1024
+# 持续旋转的精灵（子机、樱花）的旋转帧表分辨率：每圈帧数（1 度一帧，按需填充）
+ROTATION_TABLE_STEPS = 360
+# HUD 文字格式（% 格式化，配合 _format_hud 只在数值变化时重新格式化）
+HUD_FMT_SCORE_DIGITS = "%09d"
+HUD_FMT_BOMBS = "BOMBS  %d/%d"
+HUD_FMT_POWER = "POWER  %.2f/%.2f"
+HUD_FMT_GRAZE = "GRAZE  %d"
+HUD_FMT_DEBUG = "E:%d EB:%d"
+HUD_FMT_TIME = "TIME %02d"
+# HUD 文字描边：8 方向偏移
+HUD_OUTLINE_OFFSETS = [(-1, -1), (1, -1), (-1, 1), (1, 1), (0, -1), (0, 1), (-1, 0), (1, 0)]
+
 
 from view.enemy_renderer import EnemyRenderer
 from view.boss_renderer import BossRenderer
@@ -84,15 +114,87 @@ class Renderer:
         self.enemy_renderer = EnemyRenderer(screen, assets)
         self.boss_renderer = BossRenderer(screen, assets)
         
-        # 动画状态缓存：{ id(actor): {"state": str, "frame_index": int, "timer": float} }
-        self.anim_cache = {}
         
         # 樱花 VFX 状态
         self.sakura_rotation = 0.0
+        # 本帧开始时的 SDL 毫秒计时，闪烁类效果统一读取
+        self._frame_ticks = 0
+
+        # 本帧待提交的精灵 blit（按绘制顺序累积，一次 Surface.blits 提交）
+        self._blit_batch: list[tuple[pygame.Surface, tuple[int, int] | list[tuple[int, int]]]] = []
+        # pygame-ce 提供更快的 fblits（只接受位置，无 area/flags；支持 (Surface, [位置, ...]) 分组形式）
+        self._fblits = getattr(screen, "fblits", None)
+
+        # 已解析的精灵图：{精灵名: Surface}，热路径上省去 assets.get_image 调用
+        self._img_cache: dict[str, pygame.Surface] = {}
+        # 精灵图尺寸：{精灵名: (w, h)}，用于剔除与居中
+        self._sprite_size_cache: dict[str, tuple[int, int]] = {}
+        # 辉光层上一帧画过的区域，下一帧只清除这些区域
+        self._glow_dirty: list[pygame.Rect] = []
+        # 本帧发光层算出的激光折线顶点：{id(actor): 顶点列表}，主体绘制时直接复用
+        self._laser_points: dict[int, list[tuple[int, int]]] = {}
+        # 冲击波层上次画过的区域，下次绘制前只清除这些区域
+        self._vfx_dirty: list[pygame.Rect] = []
+        # 对话框背景（半透明底色 + 白色边框），内容固定，首次绘制时生成
+        self._dialogue_box: pygame.Surface | None = None
+        # 非说话方的变暗立绘：{立绘键: Surface}
+        self._dimmed_portraits: dict[str, pygame.Surface] = {}
+        # 立绘键解析结果：{(基础键, 差分): 图片键}
+        self._portrait_keys: dict[tuple[str, str | None], str] = {}
+
+        # 旋转后的子弹图：{(id(原图), 角度档位): (Surface, 半宽, 半高)}（LRU）
+        self._rot_cache: dict[tuple[int, int], tuple[pygame.Surface, int, int]] = {}
+        # 持续旋转精灵的旋转帧表：{精灵名: [(Surface, 半宽, 半高) | None] * ROTATION_TABLE_STEPS}
+        self._rot_tables: dict[str, list[tuple[pygame.Surface, int, int] | None]] = {}
+        # 类型 → (Surface, X偏移, Y偏移, w, h)，由精灵映射表在构造时解析（资源此时已加载）
+        self._resolve_sprite_tables()
+
+        # 子机图片缓存：(精灵名, Surface)
+        self._option_img: tuple[str, pygame.Surface] | None = None
+
+        # HUD 文字表面缓存（LRU）：{(text, color): Surface}
+        self._hud_cache: dict[tuple[str, tuple[int, int, int]], pygame.Surface] = {}
+
+        # 擦弹范围覆盖层：{半径: Surface}
+        self._graze_overlay_cache: dict[int, pygame.Surface] = {}
+
+        # HUD 各行上次格式化的结果：{格式: (数值, 文字)}
+        self._hud_fmt_cache: dict[str, tuple[tuple, str]] = {}
+
+        # SCORE 数字字形：{color: ([0-9 的 Surface], [步进宽度])}
+        self._digit_glyphs: dict[tuple[int, int, int], tuple[list[pygame.Surface], list[int]]] = {}
+        self._score_prefix_w: int | None = None
+        # SCORE 行的描边字形（8 方向预先合成，四周各留 1 像素）：([0-9 的描边], 前缀描边)
+        self._score_outlines: tuple[list[pygame.Surface], pygame.Surface] | None = None
+
+        # 合成好的描边文字（LRU）：{(text, color): Surface}
+        self._outlined_cache: dict[tuple[str, tuple[int, int, int]], pygame.Surface] = {}
+
+        # Cut-in 立绘副本：(原图, 游戏区域宽度, Surface)
+        self._cutin_img: tuple[pygame.Surface, int, pygame.Surface] | None = None
+
+        # 滚动背景的双倍高度拼接图：(原背景, Surface)
+        self._bg2x: tuple[pygame.Surface, pygame.Surface] | None = None
+
+        # 残机图标条：{(lives, max_lives): Surface}
+        self._life_strips: dict[tuple[int, int], pygame.Surface] = {}
+
+        # Boss 血条合成缓存：(填充宽度, 背景图, 合成后的 Surface)
+        self._boss_bar: tuple[int, pygame.Surface, pygame.Surface] | None = None
+
+        # PoC 线缓存：(高度, 比例) 及对应矩形
+        self._poc_key: tuple[int, float] | None = None
+        self._poc_rect: pygame.Rect | None = None
+
+        # 侧边栏内容签名：本帧绘制的 / 上次提交到显示器的
+        # 侧边栏未变化时只提交游戏区域（背景滚动，游戏区域每帧都在变）
+        self._sidebar_key: tuple | None = None
+        self._presented_sidebar_key: tuple | None = None
+        # 侧边栏成品快照：(签名, Surface, HUD 结束的 y)；签名不变时整块 blit，免去逐行文字绘制
+        self._sidebar_snapshot: tuple[tuple, pygame.Surface, int] | None = None
 
     def render(self, state: GameState, flip: bool = True) -> None:
-        GAME_WIDTH = 480
-        SIDEBAR_WIDTH = 240
+        self._frame_ticks = pygame.time.get_ticks()
         SCREEN_HEIGHT = state.height
 
         # 1. 清空全屏 / 绘制侧边栏背景
@@ -119,53 +221,94 @@ class Renderer:
             # 计算偏移量 (0 到 height)
             offset_y = (state.time * scroll_speed) % state.height 
             
-            # 绘制两张图以实现循环
-            self.screen.blit(bg, (0, offset_y))
-            self.screen.blit(bg, (0, offset_y - state.height))
+            if bg.get_height() == state.height:
+                # 上下拼接两张背景的长图只建一次，每帧从中截取一屏，一次 blit
+                bg2x = self._bg2x
+                if bg2x is None or bg2x[0] is not bg:
+                    w, h = bg.get_size()
+                    tall = pygame.Surface((w, h * 2), pygame.SRCALPHA)
+                    # 取最大值即原样拷贝像素（含 alpha），贴到屏幕时与直接绘制背景一致
+                    tall.blit(bg, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+                    tall.blit(bg, (0, h), special_flags=pygame.BLEND_RGBA_MAX)
+                    tall = tall.convert_alpha()
+                    bg2x = self._bg2x = (bg, tall)
+                src_y = state.height - int(offset_y)
+                self.screen.blit(bg2x[1], (0, 0), (0, src_y, bg.get_width(), state.height))
+            else:
+                # 绘制两张图以实现循环
+                self.screen.blit(bg, (0, offset_y))
+                self.screen.blit(bg, (0, offset_y - state.height))
         else:
             self.screen.fill((0, 0, 0))
         
-        # 简单的垃圾回收：移除不在当前 state.actors 中的 actor 缓存
-        current_actor_ids = {id(a) for a in state.actors}
-        for aid in list(self.anim_cache.keys()):
-            if aid not in current_actor_ids:
-                del self.anim_cache[aid]
-
-        # 初始化本帧的共享发光层
-        if not hasattr(self, 'glow_surface') or self.glow_surface.get_size() != (GAME_WIDTH, SCREEN_HEIGHT):
-            self.glow_surface = pygame.Surface((GAME_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        else:
-            self.glow_surface.fill((0, 0, 0, 0))
-
-        # Pass 1: 绘制激光发光层 (Glow Pass)
-        for actor in state.actors:
-            if actor.has(LaserTag):
-                self._draw_laser_glow(actor)
-        
-        # 将发光层混合到屏幕（在实体之前，或者在背景之上）
-        self.screen.blit(self.glow_surface, (0, 0))
+        # Boss HUD 由 GameState 直接维护，无需遍历查找
+        boss_hud = None
+        if state.boss_hud_actor is not None:
+            h = state.boss_hud_actor.get(BossHudData)
+            if h and h.visible:
+                boss_hud = h
 
-        # Pass 2: 绘制所有游戏对象主体 (Main Pass)
+        # 单次遍历 actors：分层、收集激光/冲击波
         # 分层渲染：普通 -> 子弹 -> Boss (Boss > Bullets 要求)
+        lasers = []
+        shockwaves = []
         layer_boss = []
         layer_bullet = []
         layer_normal = []
         
+        # 循环内使用局部绑定，省去每个 actor 的属性查找
+        has = Actor.has
+        get = Actor.get
+        add_bullet = layer_bullet.append
+        add_normal = layer_normal.append
+        boss_kind = EnemyKind.BOSS
+
         for actor in state.actors:
-            # Boss
-            ek = actor.get(EnemyKindTag)
-            if ek and ek.kind == EnemyKind.BOSS:
-                layer_boss.append(actor)
+            # Bullets（数量最多，最先判断；子弹不会同时是激光/冲击波/Boss）
+            if has(actor, EnemyBulletKindTag) or has(actor, PlayerBulletKindTag):
+                add_bullet(actor)
                 continue
+
+            if has(actor, LaserTag):
+                lasers.append(actor)
+            if has(actor, Shockwave):
+                shockwaves.append(actor)
             
-            # Bullets
-            if actor.get(PlayerBulletKindTag) or actor.get(EnemyBulletKindTag):
-                layer_bullet.append(actor)
+            # Boss
+            ek = get(actor, EnemyKindTag)
+            if ek and ek.kind == boss_kind:
+                layer_boss.append(actor)
                 continue
             
             # Others
-            layer_normal.append(actor)
-            
+            add_normal(actor)
+        
+        # 初始化本帧的共享发光层
+        if not hasattr(self, 'glow_surface') or self.glow_surface.get_size() != (GAME_WIDTH, SCREEN_HEIGHT):
+            self.glow_surface = pygame.Surface((GAME_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+            self._glow_dirty.clear()
+        elif self._glow_dirty:
+            # 只清除上一帧画过辉光的区域；覆盖面积过半时整体清空更快
+            dirty = self._glow_dirty
+            if sum(r.w * r.h for r in dirty) * 2 > GAME_WIDTH * SCREEN_HEIGHT:
+                self.glow_surface.fill((0, 0, 0, 0))
+            else:
+                for r in dirty:
+                    self.glow_surface.fill((0, 0, 0, 0), r)
+            dirty.clear()
+
+        # Pass 1: 绘制激光发光层 (Glow Pass)
+        self._laser_points.clear()
+        for actor in lasers:
+            self._draw_laser_glow(actor)
+        
+        # 将发光层混合到屏幕（在实体之前，或者在背景之上）
+        # 本帧没有画辉光时跳过；否则只混合画过的区域
+        if self._glow_dirty:
+            area = self._glow_dirty[0].unionall(self._glow_dirty[1:])
+            self.screen.blit(self.glow_surface, area.topleft, area)
+
+        # Pass 2: 绘制所有游戏对象主体 (Main Pass)
         # 绘制顺序
         # 先绘制樱花（在角色背后）
         self._render_sakura(state)
@@ -173,105 +316,221 @@ class Renderer:
         for actor in layer_normal:
             self._draw_actor(actor, state)
             
-        for actor in layer_bullet:
-            self._draw_actor(actor, state)
+        self._draw_bullet_layer(layer_bullet, state)
             
         for actor in layer_boss:
             self._draw_actor(actor, state)
+        self._flush_blits()
 
         # Draw Shockwaves (Overlay on top of normal game elements)
-        self._draw_shockwaves(state)
+        self._draw_shockwaves(state, shockwaves)
 
-        # 绘制子机（在玩家精灵之上）
+        # 绘制子机（在玩家精灵之上），同样加入批量 blit
         self._render_options(state)
+        self._flush_blits()
 
         # 绘制 PoC 线
         self._draw_poc_line(state)
 
         # Boss HUD (保留在游戏区域内)
-        self._render_boss_hud(state)
+        self._render_boss_hud(state, boss_hud)
 
         # 4. 解除 Clip，绘制侧边栏 UI
         self.screen.set_clip(None)
 
         # 玩家 HUD (移至侧边栏)
-        self._render_hud(state)
+        self._render_hud(state, boss_hud)
+
+        # 解除 Clip 后绘制的覆盖层可能越过侧边栏（立绘从右侧滑入），本帧必须整屏提交
+        overlay = False
 
         # Cut-in Animation (Overlay)
         if state.cutin.active:
             self._render_cutin(state)
+            overlay = True
 
         # Dialogue Overlay
         if state.dialogue.active:
             self._render_dialogue(state)
+            overlay = True
 
         if flip:
-            pygame.display.flip()
+            if overlay:
+                # 覆盖层消失后的第一帧也要整屏刷新，擦掉侧边栏上的残影
+                pygame.display.flip()
+                self._presented_sidebar_key = None
+            elif self._sidebar_key is not None and self._sidebar_key == self._presented_sidebar_key:
+                pygame.display.update(game_rect)
+            else:
+                pygame.display.flip()
+                self._presented_sidebar_key = self._sidebar_key
+        else:
+            # 由调用方提交（如暂停菜单覆盖全屏），下一帧需要整屏刷新
+            self._presented_sidebar_key = None
+
+    def _flush_blits(self) -> None:
+        """提交累积的精灵 blit。直接绘制到屏幕之前必须先调用，以保持绘制顺序。"""
+        if self._blit_batch:
+            if self._fblits is not None:
+                self._fblits(self._blit_batch)
+            else:
+                self.screen.blits(self._blit_batch, doreturn=False)
+            self._blit_batch.clear()
 
-    def _draw_actor(self, actor: Actor, state: GameState = None) -> None:
-        """绘制精灵和可选的渲染提示。"""
-        pos = actor.get(Position)
-        if not pos:
-            return
+    def _draw_bullet_layer(self, actors: list[Actor], state: GameState) -> None:
+        """
+        子弹层：所有子弹都在一个局部循环内查表、算好坐标直接加入批量 blit，
+        不经过 _draw_actor；只有带角度的玩家子弹需要额外旋转。
+        完全位于游戏区域外的子弹直接跳过（AABB 剔除）。
+        """
+        append = self._blit_batch.append
+        img_get = self._img_cache.get
+        get_image = self._image
+        size_get = self._sprite_size_cache.get
+        get_size = self._sprite_size
+        pb_get = self._pb_res.get
+        pb_default = self._pb_default
+        eb_get = self._eb_res.get
+        eb_default = self._eb_default
+        cull_w = state.width
+        cull_h = state.height
+
+        for actor in actors:
+            pos, sprite, _ = actor.view(RENDER_COMPONENTS)
+            if not pos:
+                continue
 
-        # 优先检查是否是玩家子弹（通过类型查表渲染）
-        bullet_kind_tag = actor.get(PlayerBulletKindTag)
-        if bullet_kind_tag:
-            sprite_name, ox, oy = PLAYER_BULLET_SPRITES.get(
-                bullet_kind_tag.kind, DEFAULT_BULLET_SPRITE
-            )
-            image = self.assets.get_image(sprite_name)
-            
-            # 旋转逻辑：根据速度方向旋转子弹
-            vel = actor.get(Velocity)
-            if vel and (vel.vec.x != 0 or vel.vec.y != 0):
-                # 默认朝上 (0, -1) -> 对应角度 90度 (atan2(-1, 0) = -90? No, standard math angle)
-                # Math: Right=0, Up=90 (in standard cartesian), but screen Y is down.
-                # Screen coords: Right=(1,0), Down=(0,1), Up=(0,-1).
-                # atan2(y, x): atan2(0, 1)=0, atan2(1, 0)=90, atan2(-1,0)=-90.
-                # We want Up (atan2=-90) to be Rotation 0.
-                # Angle = -math.degrees(atan2(vy, vx)) - 90
-                # Ex: Up (0, -1) -> atan2=-90 -> -(-90)-90 = 0. Correct.
-                # Ex: Right (1, 0) -> atan2=0 -> -0-90 = -90. Clockwise 90. Correct.
-                angle = -math.degrees(math.atan2(vel.vec.y, vel.vec.x)) - 90
-                
-                # 只有当角度显著时才旋转（优化）
-                if abs(angle) > 0.1:
-                    image = pygame.transform.rotate(image, angle)
-                    # 旋转后使用中心点绘制，不再使用 ox/oy (ox/oy 本质就是 -w/2, -h/2)
-                    rect = image.get_rect(center=(int(pos.x), int(pos.y)))
-                    self.screen.blit(image, rect)
-                    return
-
-            # 无旋转（垂直向上）或无速度：使用默认偏移绘制（即 TopLeft）
-            x = int(pos.x + ox)
-            y = int(pos.y + oy)
-            self.screen.blit(image, (x, y))
-            return
+            # 玩家子弹（通过类型查表渲染）
+            tag = actor.get(PlayerBulletKindTag)
+            if tag is not None:
+                image, ox, oy, w, h = pb_get(tag.kind, pb_default)
+                # 保守剔除：旋转后外接矩形的半边长不超过 (w + h) / 2，离开游戏区域即跳过（也省去旋转）
+                r = w + h
+                if pos.x + r < 0 or pos.y + r < 0 or pos.x - r >= cull_w or pos.y - r >= cull_h:
+                    continue
+
+                # 旋转逻辑：根据速度方向旋转子弹
+                vel = actor.get(Velocity)
+                if vel is not None:
+                    vx, vy = vel.vec
+                else:
+                    vx = vy = 0
+                # 大多数自机子弹垂直向上飞行 (vx == 0, vy < 0)，档位必为 0：跳过 atan2 直接按原图绘制
+                if vx != 0 or vy > 0:
+                    # 默认朝上 (0, -1) -> 对应角度 90度 (atan2(-1, 0) = -90? No, standard math angle)
+                    # Math: Right=0, Up=90 (in standard cartesian), but screen Y is down.
+                    # Screen coords: Right=(1,0), Down=(0,1), Up=(0,-1).
+                    # atan2(y, x): atan2(0, 1)=0, atan2(1, 0)=90, atan2(-1,0)=-90.
+                    # We want Up (atan2=-90) to be Rotation 0.
+                    # Angle = -math.degrees(atan2(vy, vx)) - 90
+                    # Ex: Up (0, -1) -> atan2=-90 -> -(-90)-90 = 0. Correct.
+                    # Ex: Right (1, 0) -> atan2=0 -> -0-90 = -90. Clockwise 90. Correct.
+                    angle = -math.degrees(math.atan2(vy, vx)) - 90
+
+                    # 角度按 BULLET_ROTATION_STEP 量化，档位 0 视为不旋转
+                    bucket = round(angle / BULLET_ROTATION_STEP) % (360 // BULLET_ROTATION_STEP)
+                    if bucket:
+                        rotated, hw, hh = self._get_rotated(image, bucket)
+                        # 旋转后使用中心点绘制，不再使用 ox/oy (ox/oy 本质就是 -w/2, -h/2)
+                        append((rotated, (int(pos.x) - hw, int(pos.y) - hh)))
+                        continue
+
+                # 无旋转（垂直向上）或无速度：使用默认偏移绘制（即 TopLeft）
+                append((image, (int(pos.x + ox), int(pos.y + oy))))
+                continue
 
-        # 检查是否是敌人子弹（通过类型查表渲染）
-        enemy_bullet_kind_tag = actor.get(EnemyBulletKindTag)
-        if enemy_bullet_kind_tag:
-            # 优先检查 SpriteInfo 覆盖
-            sprite_info = actor.get(SpriteInfo)
-            if sprite_info and sprite_info.name:
-                image = self.assets.get_image(sprite_info.name)
-                # 自动居中
-                w, h = image.get_size()
+            # 敌人子弹（通过类型查表渲染）
+            tag = actor.get(EnemyBulletKindTag)
+            if tag is None:
+                continue
+            if sprite and sprite.name:
+                # SpriteInfo 覆盖：自动居中
+                name = sprite.name
+                w, h = size_get(name) or get_size(name)
                 ox, oy = -w // 2, -h // 2
+                image = None
             else:
-                sprite_name, ox, oy = ENEMY_BULLET_SPRITES.get(
-                    enemy_bullet_kind_tag.kind, DEFAULT_ENEMY_BULLET_SPRITE
-                )
-                image = self.assets.get_image(sprite_name)
-            
+                image, ox, oy, w, h = eb_get(tag.kind, eb_default)
             x = int(pos.x + ox)
             y = int(pos.y + oy)
-            self.screen.blit(image, (x, y))
+            if x >= cull_w or y >= cull_h or x + w <= 0 or y + h <= 0:
+                continue
+            if image is None:
+                image = img_get(name) or get_image(name)
+            append((image, (x, y)))
+
+    def _get_rotated(self, image: pygame.Surface, bucket: int) -> tuple[pygame.Surface, int, int]:
+        """取按角度档位旋转后的图片及其半宽/半高（缓存，LRU）。"""
+        key = (id(image), bucket)
+        cache = self._rot_cache
+        # 取出后重新插入，保持字典顺序即最近使用顺序
+        entry = cache.pop(key, None)
+        if entry is None:
+            rotated = pygame.transform.rotate(image, bucket * BULLET_ROTATION_STEP)
+            entry = (rotated, rotated.get_width() // 2, rotated.get_height() // 2)
+            if len(cache) >= BULLET_ROTATION_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        cache[key] = entry
+        return entry
+
+    def _get_rotation_frame(
+        self, name: str, image: pygame.Surface, angle: float
+    ) -> tuple[pygame.Surface, int, int]:
+        """从旋转帧表取最接近 angle 的 (旋转图, 半宽, 半高)，首次用到的档位才旋转。"""
+        table = self._rot_tables.get(name)
+        if table is None:
+            table = self._rot_tables[name] = [None] * ROTATION_TABLE_STEPS
+        i = round(angle * ROTATION_TABLE_STEPS / 360) % ROTATION_TABLE_STEPS
+        entry = table[i]
+        if entry is None:
+            rotated = pygame.transform.rotate(image, i * 360 / ROTATION_TABLE_STEPS)
+            entry = table[i] = (rotated, rotated.get_width() // 2, rotated.get_height() // 2)
+        return entry
+
+    def _resolve_sprite_tables(self) -> None:
+        """把按名称的精灵映射表解析为图片引用，热路径上一次字典查找即可取得图片与偏移。"""
+        def resolve(entry: tuple[str, int, int]) -> tuple[pygame.Surface, int, int, int, int]:
+            name, ox, oy = entry
+            w, h = self._sprite_size(name)
+            return (self._image(name), ox, oy, w, h)
+
+        self._pb_res = {kind: resolve(entry) for kind, entry in PLAYER_BULLET_SPRITES.items()}
+        self._pb_default = resolve(DEFAULT_BULLET_SPRITE)
+        self._eb_res = {kind: resolve(entry) for kind, entry in ENEMY_BULLET_SPRITES.items()}
+        self._eb_default = resolve(DEFAULT_ENEMY_BULLET_SPRITE)
+        self._en_res = {kind: resolve(entry) for kind, entry in ENEMY_SPRITES.items()}
+        self._en_default = resolve(DEFAULT_ENEMY_SPRITE)
+
+    def _sprite_size(self, name: str) -> tuple[int, int]:
+        """按名称取精灵图尺寸（缓存）。"""
+        size = self._sprite_size_cache[name] = self._image(name).get_size()
+        return size
+
+    def _image(self, name: str) -> pygame.Surface:
+        """按名称取精灵图（首次经 assets.get_image 解析后缓存）。"""
+        image = self._img_cache.get(name)
+        if image is None:
+            image = self._img_cache[name] = self.assets.get_image(name)
+        return image
+
+    @staticmethod
+    def _is_culled(state: GameState | None, x: int, y: int, w: int, h: int) -> bool:
+        """左上角 (x, y)、尺寸 w×h 的精灵是否完全位于游戏区域之外。"""
+        if state is None:
+            return False
+        return x >= state.width or y >= state.height or x + w <= 0 or y + h <= 0
+
+    def _draw_actor(self, actor: Actor, state: GameState = None) -> None:
+        """绘制精灵和可选的渲染提示（简单精灵加入批量 blit）。"""
+        pos, sprite, hint = actor.view(RENDER_COMPONENTS)
+        if not pos:
             return
+        # Surface 恒为真值，命中缓存时不产生方法调用
+        img_get = self._img_cache.get
 
         # 检查是否是激光
         if actor.has(LaserTag):
+            self._flush_blits()
             self._draw_laser(actor, pos)
             return
 
@@ -280,35 +539,34 @@ class Renderer:
         if enemy_kind_tag:
             # 优先处理 Boss
             if enemy_kind_tag.kind == EnemyKind.BOSS:
-                 if actor.get(SpriteInfo):
+                 if sprite:
+                     self._flush_blits()
                      self.boss_renderer.render(actor, state)
                      return
             
             # 如果有 SpriteInfo，优先使用 EnemyRenderer (支持动画)
-            if actor.get(SpriteInfo):
+            if sprite:
+                self._flush_blits()
                 self.enemy_renderer.render(actor, state)
                 return
 
-            sprite_name, ox, oy = ENEMY_SPRITES.get(
-                enemy_kind_tag.kind, DEFAULT_ENEMY_SPRITE
-            )
-            image = self.assets.get_image(sprite_name)
+            image, ox, oy, w, h = self._en_res.get(enemy_kind_tag.kind, self._en_default)
             x = int(pos.x + ox)
             y = int(pos.y + oy)
-            self.screen.blit(image, (x, y))
+            if not self._is_culled(state, x, y, w, h):
+                self._blit_batch.append((image, (x, y)))
             # 敌人可能需要渲染提示（如碰撞框）
-            hint = actor.get(RenderHint)
             if hint and hint.draw_collider:
                 from model.components import Collider
                 col = actor.get(Collider)
                 if col:
+                    self._flush_blits()
                     pygame.draw.circle(
                         self.screen, (255, 0, 0), (int(pos.x), int(pos.y)), int(col.radius), 1
                     )
             return
 
         # 其他实体使用 SpriteInfo 组件渲染
-        sprite = actor.get(SpriteInfo)
         if not sprite:
             return
 
@@ -317,7 +575,7 @@ class Renderer:
             return
 
         # 默认取静态图片
-        image = self.assets.get_image(sprite.name)
+        image = img_get(sprite.name) or self._image(sprite.name)
         
         # 尝试播放玩家动画
         inp = actor.get(InputState)
@@ -329,31 +587,26 @@ class Renderer:
             elif inp.right and not inp.left:
                 target_anim = "right"
             
-            # 2. 获取/初始化该 actor 的动画缓存
-            aid = id(actor)
-            if aid not in self.anim_cache:
-                self.anim_cache[aid] = {
-                    "state": target_anim,
-                    "frame_index": 0,
-                    "timer": 0.0
-                }
-            
-            cache = self.anim_cache[aid]
+            # 2. 获取/初始化该 actor 的动画状态（组件随 Actor 销毁，无需清理）
+            anim = actor.get(PlayerAnimState)
+            if anim is None:
+                anim = PlayerAnimState(state=target_anim)
+                actor.add(anim)
             
             # 3. 状态切换检测
-            if cache["state"] != target_anim:
-                cache["state"] = target_anim
-                cache["frame_index"] = 0
-                cache["timer"] = 0.0
+            if anim.state != target_anim:
+                anim.state = target_anim
+                anim.frame_index = 0
+                anim.timer = 0.0
             
             # 4. 更新动画帧
             # 设定每帧持续时间 (比如 0.05秒 ~ 3帧/60fps)
             frame_duration = 0.08
-            cache["timer"] += 1.0 / 60.0  # 假设 60 FPS，或者用 state.delta_time 如果有
+            anim.timer += 1.0 / 60.0  # 假设 60 FPS，或者用 state.delta_time 如果有
             
-            if cache["timer"] >= frame_duration:
-                cache["timer"] = 0.0
-                current_idx = cache["frame_index"]
+            if anim.timer >= frame_duration:
+                anim.timer = 0.0
+                current_idx = anim.frame_index
                 
                 # 获取当前动作的总帧数
                 frames = self.assets.player_frames.get(target_anim, [])
@@ -370,19 +623,22 @@ class Renderer:
                         if next_idx >= total_frames:
                             next_idx = 4
                             
-                    cache["frame_index"] = next_idx
+                    anim.frame_index = next_idx
 
             # 5. 取出对应帧
             frames = self.assets.player_frames.get(target_anim)
-            if frames and 0 <= cache["frame_index"] < len(frames):
-                image = frames[cache["frame_index"]]
+            if frames and 0 <= anim.frame_index < len(frames):
+                image = frames[anim.frame_index]
 
         x = int(pos.x + sprite.offset_x)
         y = int(pos.y + sprite.offset_y)
-        self.screen.blit(image, (x, y))
+        w, h = image.get_size()
+        if not self._is_culled(state, x, y, w, h):
+            self._blit_batch.append((image, (x, y)))
 
-        hint = actor.get(RenderHint)
-        if hint:
+        if hint and (hint.show_hitbox or (hint.show_graze_field and hint.graze_field_radius > 0)):
+            # 覆盖层直接绘制，先提交之前的精灵
+            self._flush_blits()
             if hint.show_hitbox:
                 pygame.draw.circle(self.screen, (255, 0, 0), (int(pos.x), int(pos.y)), 2)
             if hint.show_graze_field and hint.graze_field_radius > 0:
@@ -392,19 +648,122 @@ class Renderer:
         """绘制点收集线（Point-of-Collection）。"""
         cfg: CollectConfig = state.get_resource(CollectConfig)  # type: ignore
         poc_ratio = cfg.poc_line_ratio if cfg else 0.25
-        poc_y = int(state.height * poc_ratio)
 
-        pygame.draw.line(
-            self.screen,
-            (80, 80, 80),
-            (0, poc_y),
-            (self.screen.get_width(), poc_y),
-            1,
-        )
+        # 线的位置只取决于高度和比例，缓存矩形；1 像素水平线直接用 fill 绘制
+        key = (state.height, poc_ratio)
+        if self._poc_key != key:
+            poc_y = int(state.height * poc_ratio)
+            self._poc_rect = pygame.Rect(0, poc_y, self.screen.get_width() + 1, 1)
+            self._poc_key = key
+        self.screen.fill((80, 80, 80), self._poc_rect)
 
-    def _render_hud(self, state: GameState) -> None:
+    def _get_hud_player(self, state: GameState) -> Actor | None:
+        """获取带 HudData 的玩家（state.get_player() 直接返回维护好的引用）。"""
+        player = state.get_player()
+        if player is not None and player.has(HudData):
+            return player
+        return None
+
+    def _render_hud_text(self, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """渲染 HUD 文字，结果按 (文字, 颜色) 缓存，数值不变时直接复用。"""
+        key = (text, color)
+        cache = self._hud_cache
+        # 取出后重新插入，保持字典顺序即最近使用顺序
+        surf = cache.pop(key, None)
+        if surf is None:
+            surf = self.font_small.render(text, True, color).convert_alpha()
+            if len(cache) >= HUD_TEXT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        cache[key] = surf
+        return surf
+
+    def _compose_outline(self, outline: pygame.Surface) -> pygame.Surface:
+        """把描边色的字形按 8 方向偏移合成到一张透明表面（四周各留 1 像素），绘制时左上角偏移 (-1, -1)。"""
+        w, h = outline.get_size()
+        surf = pygame.Surface((w + 2, h + 2), pygame.SRCALPHA)
+        for ox, oy in HUD_OUTLINE_OFFSETS:
+            surf.blit(outline, (1 + ox, 1 + oy))
+        return surf
+
+    def _render_outlined_text(self, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """
+        把描边和主体文字合成到一张透明表面（四周各留 1 像素描边），绘制时左上角偏移 (-1, -1)。
+        结果按 (文字, 颜色) 缓存，每行描边文字只需一次 blit。
+        """
+        key = (text, color)
+        cache = self._outlined_cache
+        # 取出后重新插入，保持字典顺序即最近使用顺序
+        surf = cache.pop(key, None)
+        if surf is None:
+            surf = self._compose_outline(self.font_small.render(text, True, (0, 0, 0)))
+            surf.blit(self.font_small.render(text, True, color), (1, 1))
+            surf = surf.convert_alpha()
+            if len(cache) >= OUTLINED_TEXT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        cache[key] = surf
+        return surf
+
+    def _format_hud(self, fmt: str, values: tuple) -> str:
+        """格式化 HUD 文字；数值与上次相同时直接返回上次的结果。"""
+        cached = self._hud_fmt_cache.get(fmt)
+        if cached is not None and cached[0] == values:
+            return cached[1]
+        text = fmt % values
+        self._hud_fmt_cache[fmt] = (values, text)
+        return text
+
+    def _get_digit_glyphs(self, color: tuple[int, int, int]) -> tuple[list[pygame.Surface], list[int]]:
+        """获取 0-9 的数字字形及各自的步进宽度（每种颜色只渲染一次）。"""
+        glyphs = self._digit_glyphs.get(color)
+        if glyphs is None:
+            surfs = [self.font_small.render(str(d), True, color).convert_alpha() for d in range(10)]
+            advances = [self.font_small.size(str(d))[0] for d in range(10)]
+            glyphs = (surfs, advances)
+            self._digit_glyphs[color] = glyphs
+        return glyphs
+
+    def _blit_score(self, x: int, y: int, score: int, color: tuple[int, int, int]) -> None:
+        """用预渲染的数字字形拼出带描边的 SCORE 行，分数变化时无需重新光栅化文字。"""
+        prefix = "SCORE  "
+        prefix_w = self._score_prefix_w
+        if prefix_w is None:
+            prefix_w = self._score_prefix_w = self.font_small.size(prefix)[0]
+
+        # 9 位数字（不足补零），逐位计算 x 坐标
+        text = self._format_hud(HUD_FMT_SCORE_DIGITS, (score,))
+        if not text.isdigit():
+            # 含负号等非数字字符时没有对应字形，整行按普通描边文字绘制
+            self.screen.blit(self._render_outlined_text(prefix + text, color), (x - 1, y - 1))
+            return
+        digits = [int(c) for c in text]
+        black_glyphs, advances = self._get_digit_glyphs((0, 0, 0))
+        main_glyphs, _ = self._get_digit_glyphs(color)
+        outlines = self._score_outlines
+        if outlines is None:
+            outlines = self._score_outlines = (
+                [self._compose_outline(g).convert_alpha() for g in black_glyphs],
+                self._compose_outline(self._render_hud_text(prefix, (0, 0, 0))).convert_alpha(),
+            )
+        outline_glyphs, outline_prefix = outlines
+        digit_xs = []
+        cur_x = prefix_w
+        for d in digits:
+            digit_xs.append(cur_x)
+            cur_x += advances[d]
+
+        # 先画全部描边（每个字形一次 blit），再画主体
+        blit_seq = [(outline_prefix, (x - 1, y - 1))]
+        for d, dx in zip(digits, digit_xs):
+            blit_seq.append((outline_glyphs[d], (x + dx - 1, y - 1)))
+        blit_seq.append((self._render_hud_text(prefix, color), (x, y)))
+        for d, dx in zip(digits, digit_xs):
+            blit_seq.append((main_glyphs[d], (x + dx, y)))
+        self.screen.blits(blit_seq, doreturn=False)
+
+    def _render_hud(self, state: GameState, boss_hud: BossHudData | None) -> None:
         """使用 HudData 和 EntityStats 绘制玩家 HUD。"""
-        player = next((a for a in state.actors if a.has(PlayerTag) and a.get(HudData)), None)
+        self._sidebar_key = None
+        player = self._get_hud_player(state)
         if not player:
             return
 
@@ -412,37 +771,35 @@ class Renderer:
         if not hud:
             return
 
-        lines = [
-            f"SCORE  {hud.score:09d}",
-            f"LIVES  {hud.lives}/{hud.max_lives}   BOMBS  {hud.bombs}/{hud.max_bombs}",
-            f"POWER  {hud.power:.2f}/{hud.max_power:.2f}",
-            f"GRAZE  {hud.graze_count}",
-        ]
-
-        # 调试统计信息
+        # 侧边栏显示内容的签名（新增侧边栏显示项时需同步加入）
         s = state.entity_stats
-        lines.append(
-            f"ENT   total {s.total:3d}  E {s.enemies:3d}  "
-            f"EB {s.enemy_bullets:3d}  PB {s.player_bullets:3d}  IT {s.items:3d}"
+        boss_key = None
+        if boss_hud:
+            boss_key = (
+                boss_hud.boss_name, boss_hud.is_spell_card, boss_hud.spell_name,
+                int(boss_hud.timer_seconds), boss_hud.timer_seconds < 10,
+            )
+        self._sidebar_key = (
+            hud.score, hud.lives, hud.max_lives, hud.bombs, hud.max_bombs,
+            hud.power, hud.max_power, hud.graze_count,
+            s.enemies, s.enemy_bullets, boss_key,
         )
 
+        # 侧边栏背景和分割线是静态的，内容不变时直接贴上次的成品
+        snapshot = self._sidebar_snapshot
+        if snapshot is not None and snapshot[0] == self._sidebar_key:
+            self.screen.blit(snapshot[1], (state.width, 0))
+            self._render_graze_energy_bar(state, hud, snapshot[2])
+            return
+
         # 侧边栏起始 X
         x = state.width + 20
         y = 30
         line_h = 32
         
         def draw_text_outline(text, color, cur_y):
-            """绘制带描边的文字"""
-            outline_color = (0, 0, 0)
-            # 简单描边：8方向
-            offsets = [(-1, -1), (1, -1), (-1, 1), (1, 1), (0, -1), (0, 1), (-1, 0), (1, 0)]
-            for ox, oy in offsets:
-                surf = self.font_small.render(text, True, outline_color)
-                self.screen.blit(surf, (x + ox, cur_y + oy))
-            
-            # 主体
-            surf = self.font_small.render(text, True, color)
-            self.screen.blit(surf, (x, cur_y))
+            """绘制带描边的文字（描边 8 方向，与主体合成为一张表面）"""
+            self.screen.blit(self._render_outlined_text(text, color), (x - 1, cur_y - 1))
 
         # 1. 标题 (Image)
         status_title = self.assets.get_image("ui_status_title")
@@ -452,31 +809,23 @@ class Renderer:
         y += status_title.get_height() + 10
 
         # 2. 分数 (黄色)
-        draw_text_outline(f"SCORE  {hud.score:09d}", (255, 220, 0), y)
+        self._blit_score(x, y, hud.score, (255, 220, 0))
         y += line_h
 
         # 3. 生命值 (红粉)
         draw_text_outline("LIVES", (255, 100, 150), y)
         y += 34 # 增加 Label 和 图标 之间的间距
         
-        icon_active = self.assets.get_image("icon_life_active")
-        icon_empty = self.assets.get_image("icon_life_empty")
-        
-        icon_x = x
-        for i in range(hud.max_lives):
-            if i < hud.lives:
-                self.screen.blit(icon_active, (icon_x, y))
-            else:
-                self.screen.blit(icon_empty, (icon_x, y))
-            icon_x += 36 # 间距
+        if hud.max_lives > 0:
+            self.screen.blit(self._get_life_strip(hud.lives, hud.max_lives), (x, y))
         
         y += 40
 
         # 4. 其他属性 (BOMB:绿, POWER:橙, GRAZE:蓝)
         items = [
-            (f"BOMBS  {hud.bombs}/{hud.max_bombs}", (100, 255, 100)),
-            (f"POWER  {hud.power:.2f}/{hud.max_power:.2f}", (255, 160, 60)),
-            (f"GRAZE  {hud.graze_count}", (100, 200, 255)),
+            (self._format_hud(HUD_FMT_BOMBS, (hud.bombs, hud.max_bombs)), (100, 255, 100)),
+            (self._format_hud(HUD_FMT_POWER, (hud.power, hud.max_power)), (255, 160, 60)),
+            (self._format_hud(HUD_FMT_GRAZE, (hud.graze_count,)), (100, 200, 255)),
         ]
 
         for text, color in items:
@@ -484,21 +833,13 @@ class Renderer:
             y += line_h
 
         # 调试统计 (E/EB)
-        s = state.entity_stats
         y += 12
-        debug_surf = self.font_small.render(f"E:{s.enemies} EB:{s.enemy_bullets}", True, (100, 100, 100))
+        debug_text = self._format_hud(HUD_FMT_DEBUG, (s.enemies, s.enemy_bullets))
+        debug_surf = self._render_hud_text(debug_text, (100, 100, 100))
         self.screen.blit(debug_surf, (x, y))
 
         # Boss Info (移至侧边栏 - Debug 下方)
-        boss_hud = None
-        # 简单查找是否有可见的 BossHudData
-        # 注意：这里假设已导入 BossHudData，参考 _render_boss_hud 应该没问题
-        for actor in state.actors:
-            h = actor.get(BossHudData)
-            if h and h.visible:
-                boss_hud = h
-                break
-        
+        # boss_hud 由 render() 从 state.boss_hud_actor 取得
         if boss_hud:
             y += 50 # 往下移多一点，避免太挤
             # 1. Boss Title (Image)
@@ -517,12 +858,39 @@ class Renderer:
             y += 32
             # 时间变红警告
             time_color = (255, 50, 50) if boss_hud.timer_seconds < 10 else (255, 255, 255)
-            draw_text_outline(f"TIME {int(boss_hud.timer_seconds):02d}", time_color, y)
+            draw_text_outline(self._format_hud(HUD_FMT_TIME, (int(boss_hud.timer_seconds),)), time_color, y)
             y += 10
 
+        # 保存侧边栏区域快照（擦弹能量条位于游戏区域，不在快照内）
+        sidebar_size = (self.screen.get_width() - state.width, self.screen.get_height())
+        surf = snapshot[1] if snapshot is not None and snapshot[1].get_size() == sidebar_size else None
+        if surf is None:
+            surf = pygame.Surface(sidebar_size, 0, self.screen)
+        surf.blit(self.screen, (0, 0), pygame.Rect((state.width, 0), sidebar_size))
+        self._sidebar_snapshot = (self._sidebar_key, surf, y)
+
         # 绘制擦弹能量条
         self._render_graze_energy_bar(state, hud, y)
 
+    def _get_life_strip(self, lives: int, max_lives: int) -> pygame.Surface:
+        """取 lives 个激活 + 其余空心的残机图标条（按 (lives, max_lives) 缓存）。"""
+        key = (lives, max_lives)
+        strip = self._life_strips.get(key)
+        if strip is None:
+            icon_active = self.assets.get_image("icon_life_active")
+            icon_empty = self.assets.get_image("icon_life_empty")
+            spacing = 36  # 间距
+            w = max(icon_active.get_width(), icon_empty.get_width())
+            h = max(icon_active.get_height(), icon_empty.get_height())
+            strip = pygame.Surface((spacing * (max_lives - 1) + w, h), pygame.SRCALPHA)
+            for i in range(max_lives):
+                icon = icon_active if i < lives else icon_empty
+                # 图标互不重叠，取最大值即原样拷贝像素（含 alpha），贴到屏幕时与逐个绘制一致
+                strip.blit(icon, (i * spacing, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            strip = strip.convert_alpha()
+            self._life_strips[key] = strip
+        return strip
+
     def _render_graze_energy_bar(self, state: GameState, hud: HudData, start_y: int) -> None:
         """绘制擦弹能量条。"""
         bar_x = 20
@@ -576,17 +944,25 @@ class Renderer:
         if int_radius <= 0:
             return
 
-        size = int_radius * 2
-        overlay = pygame.Surface((size, size), pygame.SRCALPHA)
-        center = (int_radius, int_radius)
-
-        pygame.draw.circle(
-            overlay,
-            (80, 200, 255, 90),
-            center,
-            int_radius,
-            width=2,
-        )
+        # 圆环只取决于半径，每种半径只绘制一次
+        overlay = self._graze_overlay_cache.get(int_radius)
+        if overlay is None:
+            # 不透明表面 + 颜色键 + 整体 alpha：单遍混合，不需要逐像素 alpha
+            size = int_radius * 2
+            overlay = pygame.Surface((size, size)).convert()
+            overlay.fill((0, 0, 0))
+            pygame.draw.circle(
+                overlay,
+                (80, 200, 255),
+                (int_radius, int_radius),
+                int_radius,
+                width=2,
+            )
+            overlay.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+            overlay.set_alpha(90)
+            if len(self._graze_overlay_cache) >= GRAZE_OVERLAY_CACHE_SIZE:
+                del self._graze_overlay_cache[next(iter(self._graze_overlay_cache))]
+            self._graze_overlay_cache[int_radius] = overlay
 
         x = int(pos.x) - int_radius
         y = int(pos.y) - int_radius
@@ -604,24 +980,32 @@ class Renderer:
         if not (option_state and option_cfg):
             return
 
-        # 获取子机精灵名称（根据角色配置）
+        # 获取子机精灵名称（根据角色配置），图片按名称缓存
         sprite_name = option_cfg.option_sprite
-        option_img = self.assets.get_image(sprite_name)
-
-        # 绘制每个激活的子机
+        cached = self._option_img
+        if cached is None or cached[0] != sprite_name:
+            cached = (sprite_name, self.assets.get_image(sprite_name))
+            self._option_img = cached
+            self._rot_tables.pop(sprite_name, None)
+        option_img = cached[1]
+
+        # 绘制每个激活的子机（旋转图取自旋转帧表）
         rotation_speed = -180.0  # 度/秒
         angle = (state.time * rotation_speed) % 360
-        rotated_img = pygame.transform.rotate(option_img, angle)
+        # 使用中心绘制，因为旋转会改变图像尺寸；半宽半高随旋转帧一起缓存
+        rotated_img, hw, hh = self._get_rotation_frame(sprite_name, option_img, angle)
         
-        for i in range(option_state.active_count):
-            if i >= len(option_state.current_positions):
-                continue
-
-            pos = option_state.current_positions[i]
-            # 使用中心绘制，因为旋转会改变图像尺寸
-            # rect.center = (pos[0], pos[1])
-            rect = rotated_img.get_rect(center=(int(pos[0]), int(pos[1])))
-            self.screen.blit(rotated_img, rect)
+        positions = [
+            (int(pos[0]) - hw, int(pos[1]) - hh)
+            for pos in option_state.current_positions[:option_state.active_count]
+        ]
+        if not positions:
+            return
+        if self._fblits is not None:
+            # 同一张图的多个位置合并为一项，源表面只需准备一次
+            self._blit_batch.append((rotated_img, positions))
+        else:
+            self._blit_batch.extend((rotated_img, p) for p in positions)
 
     def _render_sakura(self, state: GameState) -> None:
         """绘制无敌樱花 VFX（带旋转效果，在角色背后）。"""
@@ -648,23 +1032,9 @@ class Renderer:
         rotation_speed = 120.0  # 度/秒
         self.sakura_rotation = (self.sakura_rotation + rotation_speed * dt) % 360
         
-        # 旋转并绘制
-        rotated = pygame.transform.rotate(sakura_img, self.sakura_rotation)
-        rect = rotated.get_rect(center=(int(pos.x), int(pos.y)))
-        self.screen.blit(rotated, rect)
-
-    def _render_boss_hud(self, state: GameState) -> None:
-        """渲染 Boss HUD：血条、计时器、符卡名、剩余阶段星星。"""
-        # 查找场上的 Boss
-        boss_hud = None
-        for actor in state.actors:
-            hud = actor.get(BossHudData)
-            if hud and hud.visible:
-                boss_hud = hud
-                break
-
-        if not boss_hud:
-            return
+        # 旋转并绘制（旋转图取自旋转帧表）
+        rotated, hw, hh = self._get_rotation_frame("sakura", sakura_img, self.sakura_rotation)
+        self.screen.blit(rotated, (int(pos.x) - hw, int(pos.y) - hh))
 
     def _render_cutin(self, state: GameState) -> None:
         """Render Boss Cut-in animation overlay."""
@@ -678,8 +1048,8 @@ class Renderer:
         # Overlay removed as per user request (no dark/blur background)
 
         # 2. Portrait
-        img = self.assets.get_image(cutin.portrait_name)
-        if not img:
+        src = self.assets.get_image(cutin.portrait_name)
+        if not src:
             return
             
         # Layout: Horizontal Portrait usually across the screen or eyes.
@@ -689,13 +1059,22 @@ class Renderer:
         # User said "Flash out" (appear suddenly).
         # Let's do a quick slide + fade in.
         
+        # 立绘的私有副本（超宽时缩放），按 (原图, 宽度) 缓存；淡入淡出只改副本的 alpha，不修改共享资源
+        cached = self._cutin_img
+        if cached is None or cached[0] is not src or cached[1] != state.width:
+            iw, ih = src.get_size()
+            # Scale if too big for width
+            if iw > state.width:
+                ratio = state.width / iw
+                iw = state.width
+                ih = int(ih * ratio)
+                img = pygame.transform.smoothscale(src, (iw, ih))
+            else:
+                img = src.copy()
+            cached = (src, state.width, img)
+            self._cutin_img = cached
+        img = cached[2]
         iw, ih = img.get_size()
-        # Scale if too big for width
-        if iw > state.width:
-            ratio = state.width / iw
-            iw = state.width
-            ih = int(ih * ratio)
-            img = pygame.transform.smoothscale(img, (iw, ih))
             
         # Center Y
         target_x = 0
@@ -732,32 +1111,9 @@ class Renderer:
         
         img.set_alpha(draw_alpha)
         self.screen.blit(img, (int(draw_x), int(target_y)))
-        # Reset alpha for next use (though get_image returns ref, set_alpha might persist)
-        # Ideally we copy or reset. Pygame surfaces verify: set_alpha modifies the surface.
-        # So we should probably reset it or copy it.
-        # For performance, we reset it to 255 if we modify it?
-        # Creating a copy every frame is safer for generic asset management.
-        # But since we modify it every frame anyway, it will be overwritten next frame.
-        # Issue: if other things use "boss_cutin", they will see the alpha.
-        # FIX: Blit with special flags or creating temp surface.
-        # Pygame blit doesn't support separate alpha param unless per-pixel alpha.
-        # The image likely has per-pixel alpha. `set_alpha` on per-pixel alpha surface works as a multiplier?
-        # Yes.
-        # To be safe, we should restore alpha to 255 at end of render or use a copy.
-        # Or better: don't modify the cached asset.
-        
-        img.set_alpha(255) # Restore alpha for other uses
-
-    def _render_boss_hud(self, state: GameState) -> None:
-        """渲染 Boss HUD：血条、计时器、符卡名、剩余阶段星星。"""
-        # 查找场上的 Boss
-        boss_hud = None
-        for actor in state.actors:
-            hud = actor.get(BossHudData)
-            if hud and hud.visible:
-                boss_hud = hud
-                break
 
+    def _render_boss_hud(self, state: GameState, boss_hud: BossHudData | None) -> None:
+        """渲染 Boss HUD：血条、计时器、符卡名、剩余阶段星星。boss_hud 为场上可见的 BossHudData。"""
         if not boss_hud:
             return
 
@@ -773,17 +1129,23 @@ class Renderer:
         bar_x = (screen_w - bar_width) // 2
         bar_y = 10
 
-        # 1. Background
-        self.screen.blit(bg, (bar_x, bar_y))
-
-        # 2. Fill (根据血量比例裁剪)
-        if boss_hud.hp_ratio > 0:
-            fill_width = int(bar_width * boss_hud.hp_ratio)
+        # 背景 + 填充 + 边框合成为一张表面，按填充宽度缓存；血量不变时只需一次 blit
+        # 按预乘 alpha 合成并以 BLEND_PREMULTIPLIED 贴到屏幕，半透明边缘与逐层直接绘制一致
+        fill_width = int(bar_width * boss_hud.hp_ratio) if boss_hud.hp_ratio > 0 else 0
+        cached = self._boss_bar
+        premul = pygame.BLEND_PREMULTIPLIED
+        if cached is None or cached[0] != fill_width or cached[1] is not bg:
+            bar = pygame.Surface((bar_width, bar_height), pygame.SRCALPHA).convert_alpha()
+            # 占位图可能是不透明表面，先转为带 alpha 的格式再预乘
+            bar.blit(bg.convert_alpha().premul_alpha(), (0, 0), special_flags=premul)
+            # Fill (根据血量比例裁剪)
             if fill_width > 0:
-                self.screen.blit(fill, (bar_x, bar_y), (0, 0, fill_width, bar_height))
-
-        # 3. Frame
-        self.screen.blit(frame, (bar_x, bar_y))
+                bar.blit(fill.convert_alpha().premul_alpha(), (0, 0), (0, 0, fill_width, bar_height), special_flags=premul)
+            # Frame
+            bar.blit(frame.convert_alpha().premul_alpha(), (0, 0), special_flags=premul)
+            cached = (fill_width, bg, bar)
+            self._boss_bar = cached
+        self.screen.blit(cached[2], (bar_x, bar_y), special_flags=premul)
 
         # ====== 绘制剩余阶段图标 ======
         life_icon = self.assets.get_image("ui_boss_life_icon")
@@ -793,10 +1155,15 @@ class Renderer:
         star_x = bar_x + bar_width + 12
         star_cy = bar_y + bar_height // 2 - 6 # 再往上移一点点
         
-        for i in range(boss_hud.phases_remaining):
-            center_x = star_x + i * spacing
-            rect = life_icon.get_rect(center=(center_x, star_cy))
-            self.screen.blit(life_icon, rect)
+        # 以中心定位，偏移对所有图标相同；所有图标一次批量提交
+        icon_x = star_x - life_icon.get_width() // 2
+        icon_y = star_cy - life_icon.get_height() // 2
+        positions = [(icon_x + i * spacing, icon_y) for i in range(boss_hud.phases_remaining)]
+        if positions:
+            if self._fblits is not None:
+                self._fblits([(life_icon, positions)])
+            else:
+                self.screen.blits([(life_icon, p) for p in positions], doreturn=False)
 
         # Removed Timer and Boss Name from here (Moved to Sidebar)
 
@@ -813,7 +1180,8 @@ class Renderer:
         if laser_state.warmup_timer > 0:
             return
 
-        segments = self._get_laser_segments_for_render(pos, laser_state)
+        points = self._get_laser_points_for_render(pos, laser_state)
+        self._laser_points[id(actor)] = points
         width = int(laser_state.width)
         
         # 颜色：半透明辉光 (使用激光颜色)
@@ -821,14 +1189,10 @@ class Renderer:
         glow_color = (r, g, b, 100)
         glow_width = width + 8
         
-        for x1, y1, x2, y2 in segments:
-            pygame.draw.line(
-                self.glow_surface,
-                glow_color,
-                (int(x1), int(y1)),
-                (int(x2), int(y2)),
-                glow_width
-            )
+        # draw.lines 返回受影响的矩形，记录为下一帧需要清除的区域
+        self._glow_dirty.append(
+            pygame.draw.lines(self.glow_surface, glow_color, False, points, glow_width)
+        )
 
     def _draw_laser(self, actor: Actor, pos: Position) -> None:
         """
@@ -841,19 +1205,14 @@ class Renderer:
         if not laser_state:
             return
 
-        # 获取激光线段
-        segments = self._get_laser_segments_for_render(pos, laser_state)
+        # 获取激光折线（整条折线一次 draw.lines）；发光层已算过的直接复用
+        points = self._laser_points.pop(id(actor), None)
+        if points is None:
+            points = self._get_laser_points_for_render(pos, laser_state)
 
         if laser_state.warmup_timer > 0:
             # 预热阶段：绘制细线预警 (使用激光颜色)
-            for x1, y1, x2, y2 in segments:
-                pygame.draw.line(
-                    self.screen,
-                    laser_state.color,
-                    (int(x1), int(y1)),
-                    (int(x2), int(y2)),
-                    2
-                )
+            pygame.draw.lines(self.screen, laser_state.color, False, points, 2)
         else:
             # 激活阶段：绘制完整激光主体
             width = int(laser_state.width)
@@ -861,37 +1220,24 @@ class Renderer:
             # 绘制主体激光到屏幕（不透明）
             main_color = laser_state.color
             core_color = (255, 255, 255)  # 核心总是白色
-            
-            for x1, y1, x2, y2 in segments:
-                # 激光外壳
-                pygame.draw.line(
-                    self.screen,
-                    main_color,
-                    (int(x1), int(y1)),
-                    (int(x2), int(y2)),
-                    width
-                )
 
-                # 激光中心亮线
-                pygame.draw.line(
-                    self.screen,
-                    core_color,
-                    (int(x1), int(y1)),
-                    (int(x2), int(y2)),
-                    max(2, width // 3)
-                )
+            # 激光外壳
+            pygame.draw.lines(self.screen, main_color, False, points, width)
+
+            # 激光中心亮线
+            pygame.draw.lines(self.screen, core_color, False, points, max(2, width // 3))
 
-    def _get_laser_segments_for_render(
+    def _get_laser_points_for_render(
         self,
         laser_pos: Position,
         laser_state: LaserState
-    ) -> list:
+    ) -> list[tuple[int, int]]:
         """
-        获取激光的线段列表用于渲染。
+        获取激光的折线顶点（整数坐标）用于渲染，可直接交给 draw.lines。
 
         与碰撞系统共用相同的逻辑，但这里是渲染专用。
         """
-        segments = []
+        points = [(int(laser_pos.x), int(laser_pos.y))]
 
         if laser_state.laser_type == LaserType.STRAIGHT:
             # 直线激光
@@ -901,7 +1247,7 @@ class Renderer:
 
             end_x = laser_pos.x + laser_state.length * cos_a
             end_y = laser_pos.y + laser_state.length * sin_a
-            segments.append((laser_pos.x, laser_pos.y, end_x, end_y))
+            points.append((int(end_x), int(end_y)))
 
         elif laser_state.laser_type == LaserType.SINE_WAVE:
             # 正弦波激光
@@ -909,51 +1255,55 @@ class Renderer:
             cos_a = math.cos(rad)
             sin_a = math.sin(rad)
 
-            sample_count = max(int(laser_state.length / 20), 2)
+            length = laser_state.length
+            sample_count = max(int(length / 20), 2)
 
-            prev_x = laser_pos.x
-            prev_y = laser_pos.y
+            # 循环不变量与属性查找提到循环外；逐点算式保持不变，顶点取整结果不受影响
+            x0 = laser_pos.x
+            y0 = laser_pos.y
+            phase = laser_state.sine_phase
+            wavelength = laser_state.sine_wavelength
+            amp = laser_state.sine_amplitude
+            neg_sin_a = -sin_a
+            sin = math.sin
+            radians = math.radians
+            append = points.append
 
             for i in range(1, sample_count + 1):
-                t = i / sample_count
-                dist = t * laser_state.length
-
-                main_x = laser_pos.x + dist * cos_a
-                main_y = laser_pos.y + dist * sin_a
-
-                phase_deg = laser_state.sine_phase + (dist / laser_state.sine_wavelength) * 360
-                offset = laser_state.sine_amplitude * math.sin(math.radians(phase_deg))
-
-                perp_x = -sin_a * offset
-                perp_y = cos_a * offset
+                dist = i / sample_count * length
+                offset = amp * sin(radians(phase + (dist / wavelength) * 360))
+                append((int(x0 + dist * cos_a + neg_sin_a * offset), int(y0 + dist * sin_a + cos_a * offset)))
 
-                curr_x = main_x + perp_x
-                curr_y = main_y + perp_y
-
-                segments.append((prev_x, prev_y, curr_x, curr_y))
-                prev_x, prev_y = curr_x, curr_y
+        else:
+            # 未知类型：退化为一个点（draw.lines 至少需要两个点）
+            points.append(points[0])
 
-        return segments
+        return points
 
-    def _draw_shockwaves(self, state: GameState) -> None:
-        """绘制冲击波 VFX (Shockwave)。"""
+    def _draw_shockwaves(self, state: GameState, shockwaves: list[Actor]) -> None:
+        """绘制冲击波 VFX (Shockwave)。shockwaves 为带 Shockwave 组件的 actor。"""
         # Create a surface for alpha blending if not exists
-        GAME_WIDTH = 480
         SCREEN_HEIGHT = state.height
         
+        # 本帧没有冲击波：不清除也不混合，上一帧的残留等到下次使用时再清除
+        if not shockwaves:
+            return
+
         if not hasattr(self, 'vfx_surface') or self.vfx_surface.get_size() != (GAME_WIDTH, SCREEN_HEIGHT):
-            self.vfx_surface = pygame.Surface((GAME_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        
-        # Clear Vfx Surface
-        self.vfx_surface.fill((0, 0, 0, 0))
+            self.vfx_surface = pygame.Surface((GAME_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+            self._vfx_dirty.clear()
+        elif self._vfx_dirty:
+            # 只清除上次画过冲击波的区域；覆盖面积过半时整体清空更快
+            dirty = self._vfx_dirty
+            if sum(r.w * r.h for r in dirty) * 2 > GAME_WIDTH * SCREEN_HEIGHT:
+                self.vfx_surface.fill((0, 0, 0, 0))
+            else:
+                for r in dirty:
+                    self.vfx_surface.fill((0, 0, 0, 0), r)
+            dirty.clear()
         
-        has_wave = False
-        for actor in state.actors:
+        for actor in shockwaves:
             wave = actor.get(Shockwave)
-            if not wave:
-                continue
-            
-            has_wave = True
             pos = actor.get(Position)
             if not pos: continue
             
@@ -966,13 +1316,14 @@ class Renderer:
             rgba = (*color, alpha)
             
             try:
-                pygame.draw.circle(
+                # draw.circle 返回受影响的矩形，记录为下次需要清除的区域
+                self._vfx_dirty.append(pygame.draw.circle(
                     self.vfx_surface,
                     rgba,
                     (int(pos.x), int(pos.y)),
                     int(wave.radius),
                     wave.width
-                )
+                ))
             except (TypeError, ValueError):
                  # Fallback for old pygame
                  # Manually Draw on temp circle? Too slow?
@@ -983,8 +1334,32 @@ class Renderer:
                  # Modern pygame supports this.
                  pass
 
-        if has_wave:
-             self.screen.blit(self.vfx_surface, (0, 0))
+        # 只混合画过的区域
+        if self._vfx_dirty:
+            area = self._vfx_dirty[0].unionall(self._vfx_dirty[1:])
+            self.screen.blit(self.vfx_surface, area.topleft, area)
+
+    def _resolve_portrait_key(self, base_key: str, variant: str | None) -> str:
+        """解析立绘图片键：有对应差分图时用 "{base_key}_{variant}"，否则回退到 base_key（结果缓存）。"""
+        cache_key = (base_key, variant)
+        key = self._portrait_keys.get(cache_key)
+        if key is None:
+            key = base_key
+            if variant:
+                var_key = f"{base_key}_{variant}"
+                if self.assets.images.get(var_key):
+                    key = var_key
+            self._portrait_keys[cache_key] = key
+        return key
+
+    def _get_dimmed_portrait(self, key: str, img: pygame.Surface) -> pygame.Surface:
+        """取非说话方立绘的变暗版本（RGB 乘 100/255），每张立绘只生成一次。"""
+        dimmed = self._dimmed_portraits.get(key)
+        if dimmed is None:
+            dimmed = img.copy()
+            dimmed.fill((100, 100, 100), special_flags=pygame.BLEND_RGB_MULT)
+            self._dimmed_portraits[key] = dimmed
+        return dimmed
 
     def _render_dialogue(self, state: GameState) -> None:
         """Render dialogue overlay (portraits and text box)."""
@@ -993,8 +1368,6 @@ class Renderer:
             return
             
         line = dialogue.lines[dialogue.current_index]
-        GAME_WIDTH = 480
-        GAME_HEIGHT = 640
         
         # 1. Overlay (Dim Background)
         # Assuming we want to dim the game behind
@@ -1025,12 +1398,7 @@ class Renderer:
             speaker = line.speaker
             variant = dialogue.variants.get(speaker)
             base_key = "portrait_player" if speaker == "player" else "portrait_boss"
-            key = base_key
-            
-            if variant:
-                var_key = f"{base_key}_{variant}"
-                if self.assets.images.get(var_key):
-                    key = var_key
+            key = self._resolve_portrait_key(base_key, variant)
             
             img = self.assets.images.get(key)
             if img:
@@ -1042,12 +1410,7 @@ class Renderer:
             # Default Mode (Side by Side)
             # Left: Player (Ema)
             # Check persistent variant state
-            p_variant = dialogue.variants.get("player")
-            p_key = "portrait_player"
-            if p_variant:
-                 var_key = f"portrait_player_{p_variant}"
-                 if self.assets.images.get(var_key):
-                     p_key = var_key
+            p_key = self._resolve_portrait_key("portrait_player", dialogue.variants.get("player"))
             
             p_img = self.assets.images.get(p_key)
             if p_img:
@@ -1057,18 +1420,12 @@ class Renderer:
                 
                 img_to_draw = p_img
                 if not is_player_speaking:
-                    img_to_draw = p_img.copy()
-                    img_to_draw.fill((100, 100, 100), special_flags=pygame.BLEND_RGB_MULT)
+                    img_to_draw = self._get_dimmed_portrait(p_key, p_img)
                 
                 blit_alpha(img_to_draw, self.screen, (x, y), global_alpha)
 
             # Right: Boss (Yuki)
-            b_variant = dialogue.variants.get("boss")
-            b_key = "portrait_boss"
-            if b_variant:
-                 var_key = f"portrait_boss_{b_variant}"
-                 if self.assets.images.get(var_key):
-                     b_key = var_key
+            b_key = self._resolve_portrait_key("portrait_boss", dialogue.variants.get("boss"))
 
             b_img = self.assets.images.get(b_key)
             if b_img:
@@ -1079,8 +1436,7 @@ class Renderer:
                 
                 img_to_draw = b_img
                 if not is_boss_speaking:
-                    img_to_draw = b_img.copy()
-                    img_to_draw.fill((100, 100, 100), special_flags=pygame.BLEND_RGB_MULT)
+                    img_to_draw = self._get_dimmed_portrait(b_key, b_img)
                 
                 blit_alpha(img_to_draw, self.screen, (x, y), global_alpha)
         
@@ -1089,15 +1445,20 @@ class Renderer:
         box_y = GAME_HEIGHT - box_h - 20
         box_rect = pygame.Rect(20, box_y, GAME_WIDTH - 40, box_h)
         
-        # Draw Box Background
-        s = pygame.Surface((box_rect.width, box_rect.height), pygame.SRCALPHA)
-        s.fill((0, 0, 40, 200)) # Dark Blue
-        pygame.draw.rect(s, (255, 255, 255), s.get_rect(), 2) # White Border
+        # Draw Box Background（内容固定，只在首次或尺寸变化时生成）
+        s = self._dialogue_box
+        if s is None or s.get_size() != box_rect.size:
+            s = pygame.Surface(box_rect.size, pygame.SRCALPHA).convert_alpha()
+            s.fill((0, 0, 40, 200)) # Dark Blue
+            pygame.draw.rect(s, (255, 255, 255), s.get_rect(), 2) # White Border
+            self._dialogue_box = s
         # Apply global alpha to box
         # Box has 200 alpha. global_alpha 128 -> 100.
         # set_alpha typically overrides per-pixel alpha for blit? 
         # No, set_alpha(A) on per-pixel surface makes pixels (r,g,b, a*A/255).
-        blit_alpha(s, self.screen, box_rect.topleft, global_alpha)
+        # 缓存的表面是私有的，直接设置整体 alpha，不必每帧复制
+        s.set_alpha(global_alpha)
+        self.screen.blit(s, box_rect.topleft)
         
         # 4. Text
         font = self.assets.get_font(20)
@@ -1133,6 +1494,6 @@ class Renderer:
             curr_y += line_spacing
             
         # "Press Z" indicator (Only if not closing)
-        if not dialogue.closing and pygame.time.get_ticks() % 1000 < 500:
+        if not dialogue.closing and self._frame_ticks % 1000 < 500:
             hint = font.render("▼", True, (255, 255, 0))
             self.screen.blit(hint, (box_rect.right - 40, box_rect.bottom - 30))